@@ -1,22 +1,33 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Form, Body, Request, Header
-import fastapi
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, status, UploadFile, File, Form, Body, Query, Request, Header, BackgroundTasks
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+from selectolax.parser import HTMLParser
+import asyncio
 import os
 import logging
 from pathlib import Path
 from pydantic import BaseModel, Field, ConfigDict
 from typing import List, Optional
+import base64
 import uuid
 from datetime import datetime, timezone, timedelta
+import gzip
 import hashlib
+import hmac
+import re
+import bcrypt
 import jwt
 import secrets
+from cachetools import TTLCache
 import shutil
 import httpx
+import ijson
+import orjson
 from email_service import send_email, get_order_confirmation_email, get_order_status_update_email, get_welcome_email
 
 
@@ -32,13 +43,28 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Precompiled slug pattern shared by product/category slug generation
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Shared outbound HTTP client (created at startup, closed at shutdown) so
+# outgoing calls reuse pooled keep-alive connections instead of paying a
+# fresh TCP+TLS handshake per request
+http_client: Optional[httpx.AsyncClient] = None
+
+# Handle for the periodic Trustpilot sync loop, cancelled on shutdown
+_trustpilot_sync_task: Optional[asyncio.Task] = None
+
 # JWT Config
 JWT_SECRET = os.environ.get('JWT_SECRET', secrets.token_hex(32))
 JWT_ALGORITHM = "HS256"
 JWT_EXPIRATION_HOURS = 24
+# Prepared once: PyJWT otherwise re-encodes the secret and rebuilds the
+# allowed-algorithms list on every encode/decode
+_JWT_KEY = JWT_SECRET.encode()
+_JWT_ALGORITHMS = [JWT_ALGORITHM]
 
-# Create the main app
-app = FastAPI()
+# Create the main app (orjson serializes responses much faster than stdlib json)
+app = FastAPI(default_response_class=ORJSONResponse)
 api_router = APIRouter(prefix="/api")
 security = HTTPBearer()
 
@@ -77,20 +103,50 @@ async def rate_limit_middleware(request: Request, call_next):
     # More relaxed for login endpoints (30 attempts per minute)
     if "/auth/login" in request.url.path:
         if not rate_limit_check(client_ip, limit=30, window=60):
-            return fastapi.responses.JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={"detail": "Too many login attempts. Please try again later."}
             )
     else:
         # General rate limit
         if not rate_limit_check(client_ip, limit=100, window=60):
-            return fastapi.responses.JSONResponse(
+            return ORJSONResponse(
                 status_code=429,
                 content={"detail": "Too many requests. Please slow down."}
             )
     
     return await call_next(request)
 
+# ==================== READ CACHE ====================
+
+# In-process cache for hot, rarely-changing public reads (reviews, FAQs,
+# pages, ...). Entries expire after a short TTL and are evicted eagerly by
+# the admin mutation endpoints (for multi-worker production, use Redis).
+_read_cache = TTLCache(maxsize=256, ttl=60)
+
+def invalidate_read_cache(*keys: str):
+    for key in keys:
+        _read_cache.pop(key, None)
+
+# Active promo docs keyed by upper-cased code; hit on every cart validate.
+# Cleared wholesale on promo mutations since those are rare admin actions.
+_promo_cache = TTLCache(maxsize=512, ttl=60)
+
+# Verified customer tokens keyed by a token digest. Every authed customer
+# request otherwise pays an HS256 verify plus a Mongo lookup; entries hold
+# (customer, exp) so a token expiring inside the TTL window is still refused,
+# and failed validations are never cached.
+_jwt_cache = TTLCache(maxsize=10_000, ttl=300)
+
+def _token_cache_key(token: str) -> bytes:
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+def invalidate_customer_cache(customer_id: str):
+    """Drop cached token entries for one customer (e.g. after a profile edit)."""
+    stale = [key for key, (cached, _) in list(_jwt_cache.items()) if cached.get("id") == customer_id]
+    for key in stale:
+        _jwt_cache.pop(key, None)
+
 # ==================== SECURITY HEADERS ====================
 @app.middleware("http")
 async def security_headers_middleware(request: Request, call_next):
@@ -145,8 +201,8 @@ class OTPRecord(BaseModel):
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
     email: str
     otp: str
-    expires_at: str
-    created_at: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    expires_at: datetime  # BSON Date so the TTL index can expire it
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     verified: bool = False
 
 
@@ -304,14 +360,37 @@ class PromoCode(BaseModel):
 # ==================== HELPERS ====================
 
 def hash_password(password: str) -> str:
-    return hashlib.sha256(password.encode()).hexdigest()
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+
+# Successful verifications are cached briefly so repeated logins don't pay
+# the full bcrypt work factor (~100ms) every time
+_password_verify_cache = TTLCache(maxsize=1024, ttl=300)
+
+def verify_password(password: str, hashed: str) -> bool:
+    cache_key = hashlib.blake2b(password.encode() + hashed.encode(), digest_size=16).digest()
+    if cache_key in _password_verify_cache:
+        return True
+    valid = bcrypt.checkpw(password.encode(), hashed.encode())
+    if valid:
+        _password_verify_cache[cache_key] = True
+    return valid
+
+async def next_sort_order(counter_key: str) -> int:
+    """Atomically allocate the next sort_order value for a collection"""
+    doc = await db.counters.find_one_and_update(
+        {"_id": counter_key},
+        {"$inc": {"seq": 1}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    return doc["seq"] - 1
 
 def create_token(user_id: str) -> str:
     payload = {
         "user_id": user_id,
         "exp": datetime.now(timezone.utc) + timedelta(hours=JWT_EXPIRATION_HOURS)
     }
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=JWT_ALGORITHM)
 
 # ==================== ADMIN CREDENTIALS FROM ENV ====================
 ADMIN_USERNAME = os.environ.get("ADMIN_USERNAME", "gsnadmin")
@@ -320,7 +399,7 @@ ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD", "gsnadmin")
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         user_id = payload.get("user_id")
         if user_id == "admin-fixed":
             return {
@@ -368,8 +447,71 @@ def generate_otp() -> str:
     """Generate a 6-digit OTP"""
     return str(secrets.randbelow(900000) + 100000)
 
+# Keyed digest for OTPs at rest so a DB dump never exposes live codes
+# (blake2b keys cap at 64 bytes)
+OTP_PEPPER = os.environ.get('OTP_PEPPER', JWT_SECRET).encode()[:64]
+
+def hash_otp(otp: str) -> bytes:
+    return hashlib.blake2b(otp.encode(), key=OTP_PEPPER, digest_size=16).digest()
+
+# OTP email template, built once at import time; only {otp} varies per request
+OTP_EMAIL_SUBJECT = "Your GSN Login Code: {otp}"
+
+OTP_EMAIL_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+</head>
+<body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #000000; color: #ffffff;">
+    <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
+        <div style="text-align: center; padding: 30px 0; border-bottom: 2px solid #F5A623;">
+            <h1 style="margin: 0; color: #F5A623; font-size: 32px; font-weight: bold;">GSN</h1>
+            <p style="margin: 10px 0 0; color: #888;">GameShop Nepal</p>
+        </div>
+
+        <div style="padding: 40px 0; text-align: center;">
+            <h2 style="color: #F5A623; margin: 0 0 20px;">Your Login Code</h2>
+            <p style="color: #cccccc; margin-bottom: 30px;">Use this code to log in to your account:</p>
+
+            <div style="background: linear-gradient(145deg, #1a1a1a, #0a0a0a); border: 2px solid #F5A623; border-radius: 12px; padding: 30px; margin: 20px 0;">
+                <div style="font-size: 48px; font-weight: bold; color: #F5A623; letter-spacing: 8px; font-family: monospace;">
+                    {otp}
+                </div>
+            </div>
+
+            <p style="color: #888; font-size: 14px; margin-top: 30px;">
+                This code expires in 10 minutes.
+            </p>
+            <p style="color: #666; font-size: 12px; margin-top: 10px;">
+                If you didn't request this code, please ignore this email.
+            </p>
+        </div>
+
+        <div style="text-align: center; padding: 30px 0; border-top: 1px solid #2a2a2a;">
+            <p style="color: #888; margin: 5px 0;">Questions? Contact us on WhatsApp</p>
+            <p style="color: #888; margin: 5px 0;">+977 9743488871</p>
+        </div>
+    </div>
+</body>
+</html>
+"""
+
+OTP_EMAIL_TEXT = """
+GSN - GAMESHOP NEPAL
+
+Your Login Code: {otp}
+
+This code expires in 10 minutes.
+
+If you didn't request this code, please ignore this email.
+
+Questions? WhatsApp: +977 9743488871
+"""
+
 @api_router.post("/auth/customer/send-otp")
-async def send_customer_otp(request: OTPRequest):
+async def send_customer_otp(request: OTPRequest, background: BackgroundTasks):
     """Send OTP to customer email"""
     email = request.email.lower().strip()
     
@@ -389,79 +531,32 @@ async def send_customer_otp(request: OTPRequest):
     
     # Generate OTP
     otp = generate_otp()
-    expires_at = (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()
-    
-    # Store OTP
-    otp_record = OTPRecord(
-        email=email,
-        otp=otp,
-        expires_at=expires_at
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+    # Upsert the OTP record (one write); expired records are pruned by the TTL index
+    await db.otp_records.update_one(
+        {"email": email},
+        {
+            "$set": {
+                "otp": otp,
+                "expires_at": expires_at,
+                "verified": False,
+                "created_at": datetime.now(timezone.utc)
+            },
+            "$setOnInsert": {"id": str(uuid.uuid4())}
+        },
+        upsert=True
     )
     
-    # Delete old OTPs for this email
-    await db.otp_records.delete_many({"email": email})
-    await db.otp_records.insert_one(otp_record.model_dump())
-    
-    # Send OTP via email
+    # Send OTP via email in the background so the response isn't blocked on SMTP
     try:
-        subject = f"Your GSN Login Code: {otp}"
-        html = f"""
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        </head>
-        <body style="margin: 0; padding: 0; font-family: Arial, sans-serif; background-color: #000000; color: #ffffff;">
-            <div style="max-width: 600px; margin: 0 auto; padding: 20px;">
-                <div style="text-align: center; padding: 30px 0; border-bottom: 2px solid #F5A623;">
-                    <h1 style="margin: 0; color: #F5A623; font-size: 32px; font-weight: bold;">GSN</h1>
-                    <p style="margin: 10px 0 0; color: #888;">GameShop Nepal</p>
-                </div>
-                
-                <div style="padding: 40px 0; text-align: center;">
-                    <h2 style="color: #F5A623; margin: 0 0 20px;">Your Login Code</h2>
-                    <p style="color: #cccccc; margin-bottom: 30px;">Use this code to log in to your account:</p>
-                    
-                    <div style="background: linear-gradient(145deg, #1a1a1a, #0a0a0a); border: 2px solid #F5A623; border-radius: 12px; padding: 30px; margin: 20px 0;">
-                        <div style="font-size: 48px; font-weight: bold; color: #F5A623; letter-spacing: 8px; font-family: monospace;">
-                            {otp}
-                        </div>
-                    </div>
-                    
-                    <p style="color: #888; font-size: 14px; margin-top: 30px;">
-                        This code expires in 10 minutes.
-                    </p>
-                    <p style="color: #666; font-size: 12px; margin-top: 10px;">
-                        If you didn't request this code, please ignore this email.
-                    </p>
-                </div>
-                
-                <div style="text-align: center; padding: 30px 0; border-top: 1px solid #2a2a2a;">
-                    <p style="color: #888; margin: 5px 0;">Questions? Contact us on WhatsApp</p>
-                    <p style="color: #888; margin: 5px 0;">+977 9743488871</p>
-                </div>
-            </div>
-        </body>
-        </html>
-        """
-        
-        text = f"""
-        GSN - GAMESHOP NEPAL
-        
-        Your Login Code: {otp}
-        
-        This code expires in 10 minutes.
-        
-        If you didn't request this code, please ignore this email.
-        
-        Questions? WhatsApp: +977 9743488871
-        """
-        
-        send_email(email, subject, html, text)
-        logger.info(f"OTP sent to {email}")
+        subject = OTP_EMAIL_SUBJECT.format(otp=otp)
+        html = OTP_EMAIL_HTML.format(otp=otp)
+        text = OTP_EMAIL_TEXT.format(otp=otp)
+        background.add_task(send_email, email, subject, html, text)
+        logger.info(f"OTP email queued for {email}")
     except Exception as e:
-        logger.error(f"Failed to send OTP email: {e}")
+        logger.error(f"Failed to queue OTP email: {e}")
     
     # Return OTP in response if debug mode enabled (for testing without email)
     if os.environ.get("DEBUG_MODE") == "true":
@@ -474,27 +569,22 @@ async def verify_customer_otp(verify: OTPVerify):
     """Verify OTP and create customer session"""
     email = verify.email.lower().strip()
     
-    # Find OTP record
-    otp_record = await db.otp_records.find_one({
-        "email": email,
-        "otp": verify.otp,
-        "verified": False
-    })
-    
+    # Find OTP record and mark it verified in one round-trip
+    otp_record = await db.otp_records.find_one_and_update(
+        {"email": email, "otp": verify.otp, "verified": False},
+        {"$set": {"verified": True}}
+    )
+
     if not otp_record:
         raise HTTPException(status_code=400, detail="Invalid OTP")
-    
-    # Check expiry
-    expires_at = datetime.fromisoformat(otp_record["expires_at"].replace('Z', '+00:00'))
+
+    # Check expiry (Mongo returns naive UTC datetimes)
+    expires_at = otp_record["expires_at"]
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
     if datetime.now(timezone.utc) > expires_at:
         raise HTTPException(status_code=400, detail="OTP expired. Please request a new one.")
-    
-    # Mark OTP as verified
-    await db.otp_records.update_one(
-        {"id": otp_record["id"]},
-        {"$set": {"verified": True}}
-    )
-    
+
     # Update customer last login
     await db.customers.update_one(
         {"email": email},
@@ -529,7 +619,7 @@ async def get_current_customer(credentials: HTTPAuthorizationCredentials = Depen
     """Get current logged-in customer"""
     try:
         token = credentials.credentials
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         user_id = payload.get("user_id")
         
         # Check if it's a customer
@@ -558,15 +648,21 @@ async def get_customer_orders(current_customer: dict = Depends(get_current_custo
         {"customer_email": current_customer["email"]},
         {"_id": 0}
     ).sort("created_at", -1).to_list(100)
-    
-    # Fetch status history for each order
-    for order in orders:
-        history = await db.order_status_history.find(
-            {"order_id": order.get("id")},
+
+    # Fetch status history for all orders in one batched query
+    order_ids = [order.get("id") for order in orders]
+    histories = {}
+    if order_ids:
+        cursor = db.order_status_history.find(
+            {"order_id": {"$in": order_ids}},
             {"_id": 0}
-        ).sort("created_at", 1).to_list(50)
-        order["status_history"] = history
-    
+        ).sort("created_at", 1)
+        async for entry in cursor:
+            histories.setdefault(entry.get("order_id"), []).append(entry)
+
+    for order in orders:
+        order["status_history"] = histories.get(order.get("id"), [])
+
     return orders
 
 @api_router.get("/customer/orders/{order_id}")
@@ -593,17 +689,19 @@ async def get_customer_order_detail(order_id: str, current_customer: dict = Depe
 async def get_customer_stats(current_customer: dict = Depends(get_current_customer)):
     """Get customer statistics"""
     email = current_customer["email"]
-    
-    # Count orders
-    total_orders = await db.orders.count_documents({"customer_email": email})
-    
-    # Calculate total spent
-    orders = await db.orders.find({"customer_email": email}).to_list(1000)
-    total_spent = sum(order.get("total_amount", 0) for order in orders)
-    
-    # Count wishlist items
-    wishlist_count = await db.wishlists.count_documents({"email": email})
-    
+
+    # The three queries are independent, so overlap their round-trips;
+    # total spent is summed server-side instead of pulling every order
+    total_orders, spent_result, wishlist_count = await asyncio.gather(
+        db.orders.count_documents({"customer_email": email}),
+        db.orders.aggregate([
+            {"$match": {"customer_email": email}},
+            {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
+        ]).to_list(1),
+        db.wishlists.count_documents({"email": email})
+    )
+    total_spent = spent_result[0]["total"] if spent_result else 0
+
     return {
         "total_orders": total_orders,
         "total_spent": total_spent,
@@ -670,27 +768,31 @@ async def get_uploaded_image(filename: str):
 
 # ==================== CATEGORY ROUTES ====================
 
-@api_router.get("/categories", response_model=List[Category])
+# No response_model here: the docs are trusted DB rows already shaped by the
+# write path, so re-validating them on every read is wasted CPU
+@api_router.get("/categories")
 async def get_categories():
     categories = await db.categories.find({}, {"_id": 0}).to_list(100)
     return categories
 
-@api_router.post("/categories", response_model=Category)
+@api_router.post("/categories")
 async def create_category(category_data: CategoryCreate, current_user: dict = Depends(get_current_user)):
-    slug = category_data.name.lower().replace(" ", "-").replace("&", "and")
+    slug = generate_slug(category_data.name)
     category = Category(name=category_data.name, slug=slug)
     await db.categories.insert_one(category.model_dump())
     return category
 
-@api_router.put("/categories/{category_id}", response_model=Category)
+@api_router.put("/categories/{category_id}")
 async def update_category(category_id: str, category_data: CategoryCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.categories.find_one({"id": category_id})
-    if not existing:
+    slug = generate_slug(category_data.name)
+    updated = await db.categories.find_one_and_update(
+        {"id": category_id},
+        {"$set": {"name": category_data.name, "slug": slug}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="Category not found")
-
-    slug = category_data.name.lower().replace(" ", "-").replace("&", "and")
-    await db.categories.update_one({"id": category_id}, {"$set": {"name": category_data.name, "slug": slug}})
-    updated = await db.categories.find_one({"id": category_id}, {"_id": 0})
     return updated
 
 @api_router.delete("/categories/{category_id}")
@@ -702,7 +804,7 @@ async def delete_category(category_id: str, current_user: dict = Depends(get_cur
 
 # ==================== PRODUCT ROUTES ====================
 
-@api_router.get("/products", response_model=List[Product])
+@api_router.get("/products")
 async def get_products(category_id: Optional[str] = None, active_only: bool = True):
     query = {}
     if category_id:
@@ -800,7 +902,7 @@ async def reorder_products(order_data: ProductOrderUpdate, current_user: dict =
         await db.products.update_one({"id": product_id}, {"$set": {"sort_order": index}})
     return {"message": "Products reordered successfully"}
 
-@api_router.get("/products/{product_id}", response_model=Product)
+@api_router.get("/products/{product_id}")
 async def get_product(product_id: str):
     # First try to find by slug
     product = await db.products.find_one({"slug": product_id}, {"_id": 0})
@@ -851,63 +953,53 @@ async def get_related_products(product_id: str, limit: int = 4):
     return related[:limit]
 
 def generate_slug(name: str) -> str:
-    """Generate a URL-friendly slug from product name"""
-    import re
-    # Convert to lowercase
-    slug = name.lower()
-    # Replace spaces and special characters with hyphens
-    slug = re.sub(r'[^a-z0-9]+', '-', slug)
-    # Remove leading/trailing hyphens
-    slug = slug.strip('-')
-    # Remove multiple consecutive hyphens
-    slug = re.sub(r'-+', '-', slug)
-    return slug
-
-@api_router.post("/products", response_model=Product)
+    """Generate a URL-friendly slug from a name"""
+    # Single precompiled-regex pass: collapses whitespace/punctuation runs
+    # into one hyphen, so no separate dedupe step is needed
+    return _SLUG_RE.sub('-', name.lower().replace('&', 'and')).strip('-')
+
+def resolve_product_slug(product_data: ProductCreate, fallback: Optional[str] = None) -> str:
+    """Prefer a custom slug, then the fallback (existing slug on update), then one derived from the name"""
+    if product_data.slug and product_data.slug.strip():
+        return product_data.slug.strip().lower().replace(' ', '-')
+    return fallback or generate_slug(product_data.name)
+
+SLUG_TAKEN_DETAIL = "This URL slug is already in use. Please choose a different one."
+
+@api_router.post("/products")
 async def create_product(product_data: ProductCreate, current_user: dict = Depends(get_current_user)):
-    max_order = await db.products.find_one(sort=[("sort_order", -1)])
-    next_order = (max_order.get("sort_order", 0) + 1) if max_order else 0
+    next_order = await next_sort_order("products")
 
     product_dict = product_data.model_dump()
     product_dict["sort_order"] = next_order
-    
-    # Use custom slug if provided, otherwise auto-generate
-    if product_data.slug and product_data.slug.strip():
-        custom_slug = product_data.slug.strip().lower().replace(' ', '-')
-        # Check if slug already exists
-        existing_slug = await db.products.find_one({"slug": custom_slug})
-        if existing_slug:
-            raise HTTPException(status_code=400, detail="This URL slug is already in use. Please choose a different one.")
-        product_dict["slug"] = custom_slug
-    else:
-        product_dict["slug"] = generate_slug(product_data.name)
-    
+    product_dict["slug"] = resolve_product_slug(product_data)
+
     product = Product(**product_dict)
-    await db.products.insert_one(product.model_dump())
+    # The unique index on slug enforces this atomically, no find_one pre-check needed
+    try:
+        await db.products.insert_one(product.model_dump())
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail=SLUG_TAKEN_DETAIL)
     return product
 
-@api_router.put("/products/{product_id}", response_model=Product)
+@api_router.put("/products/{product_id}")
 async def update_product(product_id: str, product_data: ProductCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.products.find_one({"id": product_id})
+    existing = await db.products.find_one({"id": product_id}, {"_id": 0, "slug": 1})
     if not existing:
         raise HTTPException(status_code=404, detail="Product not found")
 
     update_data = product_data.model_dump()
-    
-    # Use custom slug if provided, otherwise keep existing or auto-generate
-    if product_data.slug and product_data.slug.strip():
-        custom_slug = product_data.slug.strip().lower().replace(' ', '-')
-        # Check if slug is already used by another product
-        existing_slug = await db.products.find_one({"slug": custom_slug, "id": {"$ne": product_id}})
-        if existing_slug:
-            raise HTTPException(status_code=400, detail="This URL slug is already in use. Please choose a different one.")
-        update_data["slug"] = custom_slug
-    else:
-        # Keep existing slug or generate new one
-        update_data["slug"] = existing.get("slug") or generate_slug(product_data.name)
-    
-    await db.products.update_one({"id": product_id}, {"$set": update_data})
-    updated = await db.products.find_one({"id": product_id}, {"_id": 0})
+    update_data["slug"] = resolve_product_slug(product_data, fallback=existing.get("slug"))
+
+    try:
+        updated = await db.products.find_one_and_update(
+            {"id": product_id},
+            {"$set": update_data},
+            projection={"_id": 0},
+            return_document=ReturnDocument.AFTER
+        )
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail=SLUG_TAKEN_DETAIL)
     return updated
 
 @api_router.delete("/products/{product_id}")
@@ -919,32 +1011,53 @@ async def delete_product(product_id: str, current_user: dict = Depends(get_curre
 
 # ==================== REVIEW ROUTES ====================
 
-@api_router.get("/reviews", response_model=List[Review])
-async def get_reviews():
-    reviews = await db.reviews.find({}, {"_id": 0}).sort("review_date", -1).to_list(1000)
+@api_router.get("/reviews")
+async def get_reviews(limit: int = Query(50, ge=1, le=200), skip: int = Query(0, ge=0)):
+    default_page = skip == 0 and limit == 50
+    if default_page:
+        cached = _read_cache.get("reviews")
+        if cached is not None:
+            return cached
+    projection = {"_id": 0, "id": 1, "reviewer_name": 1, "rating": 1, "comment": 1, "review_date": 1, "source": 1}
+    reviews = await db.reviews.find({}, projection).sort("review_date", -1).skip(skip).limit(limit).to_list(limit)
+    if default_page:
+        _read_cache["reviews"] = reviews
     return reviews
 
-@api_router.post("/reviews", response_model=Review)
+@api_router.post("/reviews")
 async def create_review(review_data: ReviewCreate, current_user: dict = Depends(get_current_user)):
-    review = Review(
-        reviewer_name=review_data.reviewer_name,
-        rating=review_data.rating,
-        comment=review_data.comment,
-        review_date=review_data.review_date or datetime.now(timezone.utc).isoformat()
-    )
-    await db.reviews.insert_one(review.model_dump())
+    # The input is already validated by ReviewCreate; build the stored dict
+    # once instead of round-tripping through the Review model
+    now = datetime.now(timezone.utc).isoformat()
+    review = {
+        "id": str(uuid.uuid4()),
+        "reviewer_name": review_data.reviewer_name,
+        "rating": review_data.rating,
+        "comment": review_data.comment,
+        "review_date": review_data.review_date or now,
+        "created_at": now,
+        "source": None
+    }
+    await db.reviews.insert_one(review)
+    review.pop("_id", None)
+    invalidate_read_cache("reviews")
     return review
 
-@api_router.put("/reviews/{review_id}", response_model=Review)
+@api_router.put("/reviews/{review_id}")
 async def update_review(review_id: str, review_data: ReviewCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.reviews.find_one({"id": review_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Review not found")
-
     update_data = review_data.model_dump()
-    update_data["review_date"] = review_data.review_date or existing.get("review_date")
-    await db.reviews.update_one({"id": review_id}, {"$set": update_data})
-    updated = await db.reviews.find_one({"id": review_id}, {"_id": 0})
+    if not review_data.review_date:
+        # Leave the stored review_date untouched rather than overwriting with None
+        update_data.pop("review_date", None)
+    updated = await db.reviews.find_one_and_update(
+        {"id": review_id},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Review not found")
+    invalidate_read_cache("reviews")
     return updated
 
 @api_router.delete("/reviews/{review_id}")
@@ -952,6 +1065,7 @@ async def delete_review(review_id: str, current_user: dict = Depends(get_current
     result = await db.reviews.delete_one({"id": review_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Review not found")
+    invalidate_read_cache("reviews")
     return {"message": "Review deleted"}
 
 # ==================== TRUSTPILOT SYNC ====================
@@ -959,6 +1073,7 @@ async def delete_review(review_id: str, current_user: dict = Depends(get_current
 TRUSTPILOT_DOMAIN = "gameshopnepal.com"
 TRUSTPILOT_API_KEY = os.environ.get("TRUSTPILOT_API_KEY", "")
 
+
 async def get_trustpilot_business_unit_id():
     """Get the business unit ID from Trustpilot using the domain"""
     cached = await db.trustpilot_config.find_one({"key": "business_unit_id"})
@@ -966,151 +1081,163 @@ async def get_trustpilot_business_unit_id():
         return cached["value"]
     
     # Try to find business unit ID via API or scraping
-    async with httpx.AsyncClient() as client:
-        try:
-            # First try the public find endpoint (may need API key)
-            if TRUSTPILOT_API_KEY:
-                response = await client.get(
-                    f"https://api.trustpilot.com/v1/business-units/find?name={TRUSTPILOT_DOMAIN}",
-                    headers={"apikey": TRUSTPILOT_API_KEY},
-                    timeout=10.0
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    buid = data.get("id")
-                    if buid:
-                        await db.trustpilot_config.update_one(
-                            {"key": "business_unit_id"},
-                            {"$set": {"key": "business_unit_id", "value": buid}},
-                            upsert=True
-                        )
-                        return buid
-        except Exception as e:
-            logger.error(f"Error getting business unit ID: {e}")
-    
+    try:
+        # First try the public find endpoint (may need API key)
+        if TRUSTPILOT_API_KEY:
+            response = await http_client.get(
+                f"https://api.trustpilot.com/v1/business-units/find?name={TRUSTPILOT_DOMAIN}",
+                headers={"apikey": TRUSTPILOT_API_KEY},
+                timeout=10.0
+            )
+            if response.status_code == 200:
+                data = response.json()
+                buid = data.get("id")
+                if buid:
+                    await db.trustpilot_config.update_one(
+                        {"key": "business_unit_id"},
+                        {"$set": {"key": "business_unit_id", "value": buid}},
+                        upsert=True
+                    )
+                    return buid
+    except Exception as e:
+        logger.error(f"Error getting business unit ID: {e}")
+
     return None
 
 async def fetch_trustpilot_reviews_from_page():
     """Scrape reviews from Trustpilot page as fallback"""
     reviews = []
-    async with httpx.AsyncClient() as client:
+    try:
+        response = await http_client.get(
+            f"https://www.trustpilot.com/review/{TRUSTPILOT_DOMAIN}",
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            },
+            timeout=15.0
+        )
+        if response.status_code == 200:
+            # C-based HTML tokenizer instead of regex backtracking over the page
+            tree = HTMLParser(response.text)
+
+            # Look for review data in JSON-LD script tags
+            for node in tree.css('script[type="application/ld+json"]'):
+                try:
+                    data = orjson.loads(node.text())
+                    if isinstance(data, dict) and data.get("@type") == "LocalBusiness":
+                        if "review" in data:
+                            for review in data["review"]:
+                                reviews.append({
+                                    "reviewer_name": review.get("author", {}).get("name", "Anonymous"),
+                                    "rating": int(review.get("reviewRating", {}).get("ratingValue", 5)),
+                                    "comment": review.get("reviewBody", ""),
+                                    "review_date": review.get("datePublished", datetime.now(timezone.utc).isoformat())
+                                })
+                except orjson.JSONDecodeError:
+                    continue
+
+            # Also try to parse from __NEXT_DATA__
+            for node in tree.css('script#__NEXT_DATA__'):
+                try:
+                    data = orjson.loads(node.text())
+                    props = data.get("props", {}).get("pageProps", {})
+                    review_list = props.get("reviews", [])
+
+                    for review in review_list:
+                        consumer = review.get("consumer", {})
+                        # Get the published date from dates object
+                        dates = review.get("dates", {})
+                        published_date = dates.get("publishedDate") or dates.get("experiencedDate")
+
+                        reviews.append({
+                            "reviewer_name": consumer.get("displayName", "Anonymous"),
+                            "rating": review.get("rating", 5),
+                            "comment": review.get("text", review.get("title", "")),
+                            "review_date": published_date or datetime.now(timezone.utc).isoformat()
+                        })
+                except orjson.JSONDecodeError:
+                    continue
+
+    except Exception as e:
+        logger.error(f"Error scraping Trustpilot: {e}")
+
+    return reviews
+
+# Only one sync (manual or periodic) runs at a time
+_trustpilot_sync_lock = asyncio.Lock()
+TRUSTPILOT_SYNC_INTERVAL = int(os.environ.get('TRUSTPILOT_SYNC_INTERVAL', '900'))
+
+async def _do_trustpilot_sync():
+    """Scrape Trustpilot and upsert new reviews; skips if a sync is already running"""
+    if _trustpilot_sync_lock.locked():
+        logger.info("Trustpilot sync already in progress, skipping")
+        return
+
+    async with _trustpilot_sync_lock:
         try:
-            response = await client.get(
-                f"https://www.trustpilot.com/review/{TRUSTPILOT_DOMAIN}",
-                headers={
-                    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                },
-                timeout=15.0
+            # Try scraping the Trustpilot page
+            trustpilot_reviews = await fetch_trustpilot_reviews_from_page()
+
+            # One unordered bulk upsert instead of a find_one + insert_one pair
+            # per review; the partial unique index makes the dedupe atomic
+            synced_count = 0
+            if trustpilot_reviews:
+                now = datetime.now(timezone.utc).isoformat()
+                ops = [
+                    UpdateOne(
+                        {
+                            "reviewer_name": tp_review["reviewer_name"],
+                            "comment": tp_review["comment"],
+                            "source": "trustpilot"
+                        },
+                        {"$setOnInsert": {
+                            "id": f"tp-{str(uuid.uuid4())[:8]}",
+                            "rating": tp_review["rating"],
+                            "review_date": tp_review["review_date"],
+                            "created_at": now
+                        }},
+                        upsert=True
+                    )
+                    for tp_review in trustpilot_reviews
+                ]
+                result = await db.reviews.bulk_write(ops, ordered=False)
+                synced_count = result.upserted_count
+                invalidate_read_cache("reviews")
+
+            # Update last sync time
+            await db.trustpilot_config.update_one(
+                {"key": "last_sync"},
+                {"$set": {"key": "last_sync", "value": datetime.now(timezone.utc).isoformat()}},
+                upsert=True
             )
-            if response.status_code == 200:
-                import re
-                import json
-                
-                # Try to find JSON-LD data in the page
-                html = response.text
-                
-                # Look for review data in script tags
-                json_ld_pattern = r'<script type="application/ld\+json"[^>]*>(.*?)</script>'
-                matches = re.findall(json_ld_pattern, html, re.DOTALL)
-                
-                for match in matches:
-                    try:
-                        data = json.loads(match)
-                        if isinstance(data, dict) and data.get("@type") == "LocalBusiness":
-                            if "review" in data:
-                                for review in data["review"]:
-                                    reviews.append({
-                                        "reviewer_name": review.get("author", {}).get("name", "Anonymous"),
-                                        "rating": int(review.get("reviewRating", {}).get("ratingValue", 5)),
-                                        "comment": review.get("reviewBody", ""),
-                                        "review_date": review.get("datePublished", datetime.now(timezone.utc).isoformat())
-                                    })
-                    except json.JSONDecodeError:
-                        continue
-                
-                # Also try to parse from __NEXT_DATA__
-                next_data_pattern = r'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>'
-                next_matches = re.findall(next_data_pattern, html, re.DOTALL)
-                
-                for match in next_matches:
-                    try:
-                        data = json.loads(match)
-                        props = data.get("props", {}).get("pageProps", {})
-                        review_list = props.get("reviews", [])
-                        
-                        for review in review_list:
-                            consumer = review.get("consumer", {})
-                            # Get the published date from dates object
-                            dates = review.get("dates", {})
-                            published_date = dates.get("publishedDate") or dates.get("experiencedDate")
-                            
-                            reviews.append({
-                                "reviewer_name": consumer.get("displayName", "Anonymous"),
-                                "rating": review.get("rating", 5),
-                                "comment": review.get("text", review.get("title", "")),
-                                "review_date": published_date or datetime.now(timezone.utc).isoformat()
-                            })
-                    except json.JSONDecodeError:
-                        continue
-                        
+
+            logger.info(f"Trustpilot sync finished: {synced_count} new of {len(trustpilot_reviews)} found")
+
         except Exception as e:
-            logger.error(f"Error scraping Trustpilot: {e}")
-    
-    return reviews
+            logger.error(f"Error syncing Trustpilot reviews: {e}")
+
+async def _periodic_trustpilot_sync():
+    while True:
+        await asyncio.sleep(TRUSTPILOT_SYNC_INTERVAL)
+        await _do_trustpilot_sync()
 
 @api_router.post("/reviews/sync-trustpilot")
-async def sync_trustpilot_reviews(current_user: dict = Depends(get_current_user)):
-    """Sync reviews from Trustpilot to the database"""
-    synced_count = 0
-    
-    try:
-        # Try scraping the Trustpilot page
-        trustpilot_reviews = await fetch_trustpilot_reviews_from_page()
-        
-        for tp_review in trustpilot_reviews:
-            # Check if this review already exists (by reviewer name and comment)
-            existing = await db.reviews.find_one({
-                "reviewer_name": tp_review["reviewer_name"],
-                "comment": tp_review["comment"],
-                "source": "trustpilot"
-            })
-            
-            if not existing:
-                review = {
-                    "id": f"tp-{str(uuid.uuid4())[:8]}",
-                    "reviewer_name": tp_review["reviewer_name"],
-                    "rating": tp_review["rating"],
-                    "comment": tp_review["comment"],
-                    "review_date": tp_review["review_date"],
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "source": "trustpilot"
-                }
-                await db.reviews.insert_one(review)
-                synced_count += 1
-        
-        # Update last sync time
-        await db.trustpilot_config.update_one(
-            {"key": "last_sync"},
-            {"$set": {"key": "last_sync", "value": datetime.now(timezone.utc).isoformat()}},
-            upsert=True
-        )
-        
-        return {
-            "success": True,
-            "synced_count": synced_count,
-            "total_found": len(trustpilot_reviews),
-            "message": f"Synced {synced_count} new reviews from Trustpilot"
-        }
-        
-    except Exception as e:
-        logger.error(f"Error syncing Trustpilot reviews: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to sync reviews: {str(e)}")
+async def sync_trustpilot_reviews(background: BackgroundTasks, current_user: dict = Depends(get_current_user)):
+    """Kick off a Trustpilot sync without blocking on the scrape"""
+    background.add_task(_do_trustpilot_sync)
+    return {
+        "success": True,
+        "status": "started",
+        "message": "Trustpilot sync started; new reviews will appear shortly"
+    }
 
 @api_router.get("/reviews/trustpilot-status")
 async def get_trustpilot_status(current_user: dict = Depends(get_current_user)):
     """Get Trustpilot sync status"""
-    last_sync = await db.trustpilot_config.find_one({"key": "last_sync"})
-    tp_review_count = await db.reviews.count_documents({"source": "trustpilot"})
+    # Independent lookups, so overlap them
+    last_sync, tp_review_count = await asyncio.gather(
+        db.trustpilot_config.find_one({"key": "last_sync"}),
+        db.reviews.count_documents({"source": "trustpilot"})
+    )
     
     return {
         "domain": TRUSTPILOT_DOMAIN,
@@ -1119,35 +1246,51 @@ async def get_trustpilot_status(current_user: dict = Depends(get_current_user)):
         "api_key_configured": bool(TRUSTPILOT_API_KEY)
     }
 
-@api_router.get("/faqs", response_model=List[FAQItem])
-async def get_faqs():
-    faqs = await db.faqs.find({}, {"_id": 0}).sort("sort_order", 1).to_list(100)
+@api_router.get("/faqs")
+async def get_faqs(limit: int = Query(100, ge=1, le=200), skip: int = Query(0, ge=0)):
+    default_page = skip == 0 and limit == 100
+    if default_page:
+        cached = _read_cache.get("faqs")
+        if cached is not None:
+            return cached
+    faqs = await db.faqs.find({}, {"_id": 0}).sort("sort_order", 1).skip(skip).limit(limit).to_list(limit)
+    if default_page:
+        _read_cache["faqs"] = faqs
     return faqs
 
-@api_router.post("/faqs", response_model=FAQItem)
+@api_router.post("/faqs")
 async def create_faq(faq_data: FAQItemCreate, current_user: dict = Depends(get_current_user)):
-    max_order = await db.faqs.find_one(sort=[("sort_order", -1)])
-    next_order = (max_order.get("sort_order", 0) + 1) if max_order else 0
+    next_order = await next_sort_order("faqs")
 
     faq = FAQItem(question=faq_data.question, answer=faq_data.answer, sort_order=next_order)
     await db.faqs.insert_one(faq.model_dump())
+    invalidate_read_cache("faqs")
     return faq
 
 @api_router.put("/faqs/reorder")
 async def reorder_faqs(request: Request, current_user: dict = Depends(get_current_user)):
     faq_ids = await request.json()
-    for index, faq_id in enumerate(faq_ids):
-        await db.faqs.update_one({"id": faq_id}, {"$set": {"sort_order": index}})
+    if faq_ids:
+        # One bulk write instead of one round-trip per FAQ
+        await db.faqs.bulk_write(
+            [UpdateOne({"id": faq_id}, {"$set": {"sort_order": index}})
+             for index, faq_id in enumerate(faq_ids)],
+            ordered=False
+        )
+    invalidate_read_cache("faqs")
     return {"message": "FAQs reordered successfully"}
 
-@api_router.put("/faqs/{faq_id}", response_model=FAQItem)
+@api_router.put("/faqs/{faq_id}")
 async def update_faq(faq_id: str, faq_data: FAQItemCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.faqs.find_one({"id": faq_id})
-    if not existing:
+    updated = await db.faqs.find_one_and_update(
+        {"id": faq_id},
+        {"$set": faq_data.model_dump()},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="FAQ not found")
-
-    await db.faqs.update_one({"id": faq_id}, {"$set": faq_data.model_dump()})
-    updated = await db.faqs.find_one({"id": faq_id}, {"_id": 0})
+    invalidate_read_cache("faqs")
     return updated
 
 @api_router.delete("/faqs/{faq_id}")
@@ -1155,20 +1298,26 @@ async def delete_faq(faq_id: str, current_user: dict = Depends(get_current_user)
     result = await db.faqs.delete_one({"id": faq_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="FAQ not found")
+    invalidate_read_cache("faqs")
     return {"message": "FAQ deleted"}
 
 # ==================== PAGE ROUTES ====================
 
+_PAGE_DEFAULTS = {
+    "about": {"title": "About Us", "content": "<p>Welcome to GameShop Nepal - Your trusted source for digital products since 2021.</p>"},
+    "terms": {"title": "Terms and Conditions", "content": "<p>Terms and conditions content here.</p>"},
+    "faq": {"title": "FAQ", "content": ""}
+}
+
 @api_router.get("/pages/{page_key}")
 async def get_page(page_key: str):
+    cached = _read_cache.get(f"page:{page_key}")
+    if cached is not None:
+        return cached
     page = await db.pages.find_one({"page_key": page_key}, {"_id": 0})
     if not page:
-        defaults = {
-            "about": {"title": "About Us", "content": "<p>Welcome to GameShop Nepal - Your trusted source for digital products since 2021.</p>"},
-            "terms": {"title": "Terms and Conditions", "content": "<p>Terms and conditions content here.</p>"},
-            "faq": {"title": "FAQ", "content": ""}
-        }
-        return {"page_key": page_key, **defaults.get(page_key, {"title": page_key.title(), "content": ""})}
+        return {"page_key": page_key, **_PAGE_DEFAULTS.get(page_key, {"title": page_key.title(), "content": ""})}
+    _read_cache[f"page:{page_key}"] = page
     return page
 
 @api_router.put("/pages/{page_key}")
@@ -1180,29 +1329,38 @@ async def update_page(page_key: str, title: str, content: str, current_user: dic
         "updated_at": datetime.now(timezone.utc).isoformat()
     }
     await db.pages.update_one({"page_key": page_key}, {"$set": page_data}, upsert=True)
+    invalidate_read_cache(f"page:{page_key}")
     return page_data
 
 # ==================== SOCIAL LINK ROUTES ====================
 
-@api_router.get("/social-links", response_model=List[SocialLink])
+@api_router.get("/social-links")
 async def get_social_links():
+    cached = _read_cache.get("social_links")
+    if cached is not None:
+        return cached
     links = await db.social_links.find({}, {"_id": 0}).to_list(100)
+    _read_cache["social_links"] = links
     return links
 
-@api_router.post("/social-links", response_model=SocialLink)
+@api_router.post("/social-links")
 async def create_social_link(link_data: SocialLinkCreate, current_user: dict = Depends(get_current_user)):
     link = SocialLink(**link_data.model_dump())
     await db.social_links.insert_one(link.model_dump())
+    invalidate_read_cache("social_links")
     return link
 
-@api_router.put("/social-links/{link_id}", response_model=SocialLink)
+@api_router.put("/social-links/{link_id}")
 async def update_social_link(link_id: str, link_data: SocialLinkCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.social_links.find_one({"id": link_id})
-    if not existing:
+    updated = await db.social_links.find_one_and_update(
+        {"id": link_id},
+        {"$set": link_data.model_dump()},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
         raise HTTPException(status_code=404, detail="Social link not found")
-
-    await db.social_links.update_one({"id": link_id}, {"$set": link_data.model_dump()})
-    updated = await db.social_links.find_one({"id": link_id}, {"_id": 0})
+    invalidate_read_cache("social_links")
     return updated
 
 @api_router.delete("/social-links/{link_id}")
@@ -1210,6 +1368,7 @@ async def delete_social_link(link_id: str, current_user: dict = Depends(get_curr
     result = await db.social_links.delete_one({"id": link_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Social link not found")
+    invalidate_read_cache("social_links")
     return {"message": "Social link deleted"}
 
 # ==================== CLEAR DATA ====================
@@ -1222,39 +1381,73 @@ async def clear_products(current_user: dict = Depends(get_current_user)):
 
 # ==================== SEED DATA ====================
 
-@api_router.post("/seed")
-async def seed_data():
-    social_data = [
-        {"id": "fb", "platform": "Facebook", "url": "https://facebook.com/gameshopnepal", "icon": "facebook"},
-        {"id": "ig", "platform": "Instagram", "url": "https://instagram.com/gameshopnepal", "icon": "instagram"},
-        {"id": "tt", "platform": "TikTok", "url": "https://tiktok.com/@gameshopnepal", "icon": "tiktok"},
-        {"id": "wa", "platform": "WhatsApp", "url": "https://wa.me/9779743488871", "icon": "whatsapp"},
-    ]
+SEED_SOCIAL_LINKS = [
+    {"id": "fb", "platform": "Facebook", "url": "https://facebook.com/gameshopnepal", "icon": "facebook"},
+    {"id": "ig", "platform": "Instagram", "url": "https://instagram.com/gameshopnepal", "icon": "instagram"},
+    {"id": "tt", "platform": "TikTok", "url": "https://tiktok.com/@gameshopnepal", "icon": "tiktok"},
+    {"id": "wa", "platform": "WhatsApp", "url": "https://wa.me/9779743488871", "icon": "whatsapp"},
+]
 
-    for link in social_data:
-        await db.social_links.update_one({"id": link["id"]}, {"$set": link}, upsert=True)
+SEED_FAQS = [
+    {"id": "faq1", "question": "How do I place an order?", "answer": "Simply browse our products, select the plan you want, and click 'Order Now'. This will redirect you to WhatsApp where you can complete your order.", "sort_order": 0},
+    {"id": "faq2", "question": "How long does delivery take?", "answer": "Most products are delivered instantly within minutes after payment confirmation.", "sort_order": 1},
+    {"id": "faq3", "question": "What payment methods do you accept?", "answer": "We accept eSewa, Khalti, bank transfer, and other local payment methods.", "sort_order": 2},
+    {"id": "faq4", "question": "Are your products genuine?", "answer": "Yes! All our products are 100% genuine and sourced directly from authorized channels.", "sort_order": 3},
+]
 
+@api_router.post("/seed")
+async def seed_data():
+    # Payloads stay plain dicts all the way to bulk_write; no Pydantic
+    # model round-trip is needed for trusted seed data
     reviews_data = [
         {"id": "rev1", "reviewer_name": "Sujan Thapa", "rating": 5, "comment": "Fast delivery and genuine products. Got my Netflix subscription within minutes!", "review_date": "2025-01-10T10:00:00Z", "created_at": datetime.now(timezone.utc).isoformat()},
         {"id": "rev2", "reviewer_name": "Anisha Sharma", "rating": 5, "comment": "Best prices in Nepal for digital products. Highly recommended!", "review_date": "2025-01-08T14:30:00Z", "created_at": datetime.now(timezone.utc).isoformat()},
         {"id": "rev3", "reviewer_name": "Rohan KC", "rating": 5, "comment": "Bought PUBG UC, instant delivery. Will buy again!", "review_date": "2025-01-05T09:15:00Z", "created_at": datetime.now(timezone.utc).isoformat()},
     ]
 
-    for rev in reviews_data:
-        await db.reviews.update_one({"id": rev["id"]}, {"$set": rev}, upsert=True)
-
-    default_faqs = [
-        {"id": "faq1", "question": "How do I place an order?", "answer": "Simply browse our products, select the plan you want, and click 'Order Now'. This will redirect you to WhatsApp where you can complete your order.", "sort_order": 0},
-        {"id": "faq2", "question": "How long does delivery take?", "answer": "Most products are delivered instantly within minutes after payment confirmation.", "sort_order": 1},
-        {"id": "faq3", "question": "What payment methods do you accept?", "answer": "We accept eSewa, Khalti, bank transfer, and other local payment methods.", "sort_order": 2},
-        {"id": "faq4", "question": "Are your products genuine?", "answer": "Yes! All our products are 100% genuine and sourced directly from authorized channels.", "sort_order": 3},
-    ]
+    # One bulk upsert per collection, and the three collections are
+    # independent so their writes run concurrently
+    await asyncio.gather(
+        db.social_links.bulk_write(
+            [UpdateOne({"id": link["id"]}, {"$set": link}, upsert=True) for link in SEED_SOCIAL_LINKS],
+            ordered=False
+        ),
+        db.reviews.bulk_write(
+            [UpdateOne({"id": rev["id"]}, {"$set": rev}, upsert=True) for rev in reviews_data],
+            ordered=False
+        ),
+        db.faqs.bulk_write(
+            [UpdateOne({"id": faq["id"]}, {"$set": faq}, upsert=True) for faq in SEED_FAQS],
+            ordered=False
+        )
+    )
 
-    for faq in default_faqs:
-        await db.faqs.update_one({"id": faq["id"]}, {"$set": faq}, upsert=True)
+    invalidate_read_cache("reviews", "faqs", "social_links")
 
     return {"message": "Data seeded successfully"}
 
+# Deletes ASCII non-digits in one C-level pass; anything exotic falls
+# back to the character filter below
+_NON_DIGIT_TABLE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+# Strips separators in one pass instead of chained .replace() calls; used
+# wherever a phone number becomes a lookup key (login, Take.app sync)
+_PHONE_TRANS = str.maketrans('', '', ' -\t\n')
+
+def normalize_phone(phone: str) -> str:
+    return phone.strip().translate(_PHONE_TRANS)
+
+def format_phone_number(phone: str) -> str:
+    """Normalize a phone number to bare digits with the 977 country code"""
+    phone = phone.translate(_NON_DIGIT_TABLE)
+    if phone and not phone.isdigit():
+        phone = ''.join(filter(str.isdigit, phone))
+    if phone.startswith('0'):
+        phone = phone[1:]
+    if not phone.startswith('977') and len(phone) == 10:
+        phone = '977' + phone
+    return phone
+
 # Order creation models
 class OrderItem(BaseModel):
     name: str
@@ -1271,21 +1464,14 @@ class CreateOrderRequest(BaseModel):
     remark: Optional[str] = None
 
 @api_router.post("/orders/create")
-async def create_order(order_data: CreateOrderRequest):
+async def create_order(order_data: CreateOrderRequest, background: BackgroundTasks):
     order_id = str(uuid.uuid4())
 
-    def format_phone_number(phone):
-        phone = ''.join(filter(str.isdigit, phone))
-        if phone.startswith('0'):
-            phone = phone[1:]
-        if not phone.startswith('977') and len(phone) == 10:
-            phone = '977' + phone
-        return phone
-
     formatted_phone = format_phone_number(order_data.customer_phone)
 
     items_text = ", ".join([f"{item.quantity}x {item.name}" + (f" ({item.variation})" if item.variation else "") for item in order_data.items])
 
+    now = datetime.now(timezone.utc)
     local_order = {
         "id": order_id,
         "customer_name": order_data.customer_name,
@@ -1295,22 +1481,26 @@ async def create_order(order_data: CreateOrderRequest):
         "total_amount": order_data.total_amount,
         "remark": order_data.remark,
         "items_text": items_text,
+        # Pre-masked name for the public ticker, so reads skip the split
+        "masked_first_name": order_data.customer_name.split()[0] if order_data.customer_name.strip() else "Customer",
         "status": "pending",
         "payment_screenshot": None,
         "payment_method": None,
-        "created_at": datetime.now(timezone.utc).isoformat()
+        "created_at": now.isoformat(),
+        # BSON Date twin of created_at: 8-byte index keys and native range
+        # scans for the analytics/ticker filters
+        "created_at_dt": now
     }
 
     await db.orders.insert_one(local_order)
 
-    # Send order confirmation email
+    # Send order confirmation email after the response; SMTP stays off the critical path
     if order_data.customer_email:
         try:
             subject, html, text = get_order_confirmation_email(local_order)
-            send_email(order_data.customer_email, subject, html, text)
-            logger.info(f"Order confirmation email sent to {order_data.customer_email}")
+            background.add_task(send_email, order_data.customer_email, subject, html, text)
         except Exception as e:
-            logger.error(f"Failed to send order confirmation email: {e}")
+            logger.error(f"Failed to queue order confirmation email: {e}")
 
     return {
         "success": True,
@@ -1319,8 +1509,8 @@ async def create_order(order_data: CreateOrderRequest):
     }
 
 @api_router.get("/orders")
-async def get_local_orders(current_user: dict = Depends(get_current_user)):
-    orders = await db.orders.find({}, {"_id": 0}).sort("created_at", -1).to_list(1000)
+async def get_local_orders(current_user: dict = Depends(get_current_user), limit: int = Query(200, ge=1, le=1000), skip: int = Query(0, ge=0)):
+    orders = await db.orders.find({}, {"_id": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
     return orders
 
 # ==================== PAYMENT METHODS ====================
@@ -1338,16 +1528,16 @@ class PaymentMethod(BaseModel):
 
 @api_router.get("/payment-methods")
 async def get_payment_methods():
-    methods = await db.payment_methods.find({"is_active": True}).sort("sort_order", 1).to_list(100)
-    for m in methods:
-        m.pop("_id", None)
+    cached = _read_cache.get("payment_methods")
+    if cached is not None:
+        return cached
+    methods = await db.payment_methods.find({"is_active": True}, {"_id": 0}).sort("sort_order", 1).to_list(100)
+    _read_cache["payment_methods"] = methods
     return methods
 
 @api_router.get("/payment-methods/all")
 async def get_all_payment_methods(current_user: dict = Depends(get_current_user)):
-    methods = await db.payment_methods.find().sort("sort_order", 1).to_list(100)
-    for m in methods:
-        m.pop("_id", None)
+    methods = await db.payment_methods.find({}, {"_id": 0}).sort("sort_order", 1).to_list(100)
     return methods
 
 @api_router.get("/payment-methods/{method_id}")
@@ -1363,6 +1553,7 @@ async def create_payment_method(method: PaymentMethod, current_user: dict = Depe
     method_dict["id"] = str(uuid.uuid4())
     await db.payment_methods.insert_one(method_dict)
     method_dict.pop("_id", None)
+    invalidate_read_cache("payment_methods")
     return method_dict
 
 @api_router.put("/payment-methods/{method_id}")
@@ -1370,11 +1561,13 @@ async def update_payment_method(method_id: str, method: PaymentMethod, current_u
     method_dict = method.model_dump()
     method_dict["id"] = method_id
     await db.payment_methods.update_one({"id": method_id}, {"$set": method_dict})
+    invalidate_read_cache("payment_methods")
     return method_dict
 
 @api_router.delete("/payment-methods/{method_id}")
 async def delete_payment_method(method_id: str, current_user: dict = Depends(get_current_user)):
     await db.payment_methods.delete_one({"id": method_id})
+    invalidate_read_cache("payment_methods")
     return {"message": "Payment method deleted"}
 
 # ==================== ORDER PAYMENT SCREENSHOT ====================
@@ -1386,14 +1579,10 @@ class PaymentScreenshotUpload(BaseModel):
 @api_router.post("/orders/{order_id}/payment-screenshot")
 async def upload_payment_screenshot(order_id: str, data: PaymentScreenshotUpload):
     """Upload payment screenshot for an order - automatically marks as Confirmed"""
-    order = await db.orders.find_one({"id": order_id})
-    if not order:
-        raise HTTPException(status_code=404, detail="Order not found")
-    
     # Generate invoice URL
     invoice_url = f"/invoice/{order_id}"
-    
-    await db.orders.update_one(
+
+    updated = await db.orders.find_one_and_update(
         {"id": order_id},
         {"$set": {
             "payment_screenshot": data.screenshot_url,
@@ -1401,9 +1590,12 @@ async def upload_payment_screenshot(order_id: str, data: PaymentScreenshotUpload
             "payment_uploaded_at": datetime.now(timezone.utc).isoformat(),
             "status": "Confirmed",
             "invoice_url": invoice_url
-        }}
+        }},
+        projection={"_id": 0, "id": 1}
     )
-    
+    if not updated:
+        raise HTTPException(status_code=404, detail="Order not found")
+
     return {
         "message": "Payment screenshot uploaded", 
         "order_id": order_id,
@@ -1505,9 +1697,12 @@ class NotificationBar(BaseModel):
 
 @api_router.get("/notification-bar")
 async def get_notification_bar():
-    notification = await db.notification_bar.find_one({"is_active": True})
+    cached = _read_cache.get("notification_bar")
+    if cached is not None:
+        return cached
+    notification = await db.notification_bar.find_one({"is_active": True}, {"_id": 0})
     if notification:
-        notification.pop("_id", None)
+        _read_cache["notification_bar"] = notification
     return notification
 
 @api_router.put("/notification-bar")
@@ -1515,6 +1710,7 @@ async def update_notification_bar(notification: NotificationBar, current_user: d
     notification_dict = notification.model_dump()
     notification_dict["id"] = "main"
     await db.notification_bar.update_one({"id": "main"}, {"$set": notification_dict}, upsert=True)
+    invalidate_read_cache("notification_bar")
     return notification_dict
 
 # ==================== BLOG POSTS ====================
@@ -1531,25 +1727,28 @@ class BlogPost(BaseModel):
     updated_at: Optional[str] = None
 
 @api_router.get("/blog")
-async def get_blog_posts():
-    posts = await db.blog_posts.find({"is_published": True}).sort("created_at", -1).to_list(100)
-    for p in posts:
-        p.pop("_id", None)
+async def get_blog_posts(limit: int = Query(50, ge=1, le=200), skip: int = Query(0, ge=0)):
+    default_page = skip == 0 and limit == 50
+    if default_page:
+        cached = _read_cache.get("blog_posts")
+        if cached is not None:
+            return cached
+    # The list view only needs metadata; "content" is the heavy field and is fetched per-post by slug
+    posts = await db.blog_posts.find({"is_published": True}, {"_id": 0, "content": 0}).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+    if default_page:
+        _read_cache["blog_posts"] = posts
     return posts
 
 @api_router.get("/blog/all/admin")
 async def get_all_blog_posts(current_user: dict = Depends(get_current_user)):
-    posts = await db.blog_posts.find().sort("created_at", -1).to_list(100)
-    for p in posts:
-        p.pop("_id", None)
+    posts = await db.blog_posts.find({}, {"_id": 0}).sort("created_at", -1).to_list(100)
     return posts
 
 @api_router.get("/blog/{slug}")
 async def get_blog_post(slug: str):
-    post = await db.blog_posts.find_one({"slug": slug, "is_published": True})
+    post = await db.blog_posts.find_one({"slug": slug, "is_published": True}, {"_id": 0})
     if not post:
         raise HTTPException(status_code=404, detail="Blog post not found")
-    post.pop("_id", None)
     return post
 
 @api_router.post("/blog")
@@ -1561,6 +1760,7 @@ async def create_blog_post(post: BlogPost, current_user: dict = Depends(get_curr
     post_dict["updated_at"] = post_dict["created_at"]
     await db.blog_posts.insert_one(post_dict)
     post_dict.pop("_id", None)
+    invalidate_read_cache("blog_posts")
     return post_dict
 
 @api_router.put("/blog/{post_id}")
@@ -1569,18 +1769,23 @@ async def update_blog_post(post_id: str, post: BlogPost, current_user: dict = De
     post_dict["id"] = post_id
     post_dict["updated_at"] = datetime.now(timezone.utc).isoformat()
     await db.blog_posts.update_one({"id": post_id}, {"$set": post_dict})
+    invalidate_read_cache("blog_posts")
     return post_dict
 
 @api_router.delete("/blog/{post_id}")
 async def delete_blog_post(post_id: str, current_user: dict = Depends(get_current_user)):
     await db.blog_posts.delete_one({"id": post_id})
+    invalidate_read_cache("blog_posts")
     return {"message": "Blog post deleted"}
 
 # ==================== SITE SETTINGS ====================
 
 @api_router.get("/settings")
 async def get_site_settings():
-    settings = await db.site_settings.find_one({"id": "main"})
+    cached = _read_cache.get("settings")
+    if cached is not None:
+        return cached
+    settings = await db.site_settings.find_one({"id": "main"}, {"_id": 0})
     if not settings:
         settings = {
             "id": "main", 
@@ -1591,21 +1796,21 @@ async def get_site_settings():
             "tax_label": "Tax"
         }
     settings.pop("_id", None)
+    _read_cache["settings"] = settings
     return settings
 
 @api_router.put("/settings")
 async def update_site_settings(settings: dict, current_user: dict = Depends(get_current_user)):
     settings["id"] = "main"
     await db.site_settings.update_one({"id": "main"}, {"$set": settings}, upsert=True)
+    invalidate_read_cache("settings")
     return settings
 
 # ==================== PROMO CODES ====================
 
 @api_router.get("/promo-codes")
 async def get_promo_codes(current_user: dict = Depends(get_current_user)):
-    codes = await db.promo_codes.find().sort("created_at", -1).to_list(100)
-    for c in codes:
-        c.pop("_id", None)
+    codes = await db.promo_codes.find({}, {"_id": 0}).sort("created_at", -1).to_list(100)
     return codes
 
 @api_router.post("/promo-codes")
@@ -1624,20 +1829,24 @@ async def create_promo_code(code_data: PromoCodeCreate, current_user: dict = Dep
         is_active=code_data.is_active
     )
     await db.promo_codes.insert_one(code.model_dump())
+    _promo_cache.clear()
     result = code.model_dump()
     result.pop("_id", None)
     return result
 
 @api_router.put("/promo-codes/{code_id}")
 async def update_promo_code(code_id: str, code_data: PromoCodeCreate, current_user: dict = Depends(get_current_user)):
-    existing = await db.promo_codes.find_one({"id": code_id})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Promo code not found")
-    
     update_data = code_data.model_dump()
     update_data["code"] = update_data["code"].upper()
-    await db.promo_codes.update_one({"id": code_id}, {"$set": update_data})
-    updated = await db.promo_codes.find_one({"id": code_id}, {"_id": 0})
+    updated = await db.promo_codes.find_one_and_update(
+        {"id": code_id},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Promo code not found")
+    _promo_cache.clear()
     return updated
 
 @api_router.delete("/promo-codes/{code_id}")
@@ -1645,6 +1854,7 @@ async def delete_promo_code(code_id: str, current_user: dict = Depends(get_curre
     result = await db.promo_codes.delete_one({"id": code_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Promo code not found")
+    _promo_cache.clear()
     return {"message": "Promo code deleted"}
 
 @api_router.post("/promo-codes/validate")
@@ -1655,59 +1865,82 @@ async def validate_promo_code(
     customer_email: Optional[str] = None
 ):
     """Validate a promo code with advanced rules"""
-    promo = await db.promo_codes.find_one({"code": code.upper(), "is_active": True})
+    code_key = code.upper()
+    promo = _promo_cache.get(code_key)
+    if promo is None:
+        promo = await db.promo_codes.find_one({"code": code_key, "is_active": True}, {"_id": 0})
+        if promo:
+            # Only positive lookups are cached so bad codes never linger
+            _promo_cache[code_key] = promo
     if not promo:
         raise HTTPException(status_code=404, detail="Invalid promo code")
-    
+
+    # Fetch only the state the rules on this promo actually need
+    customer_usage = 0
+    if customer_email and promo.get("max_uses_per_customer"):
+        customer_usage = await db.promo_usage.count_documents({
+            "promo_code": code.upper(),
+            "customer_email": customer_email
+        })
+
+    prior_orders = 0
+    if promo.get("first_time_only") and customer_email:
+        prior_orders = await db.orders.count_documents({"customer_email": customer_email})
+
+    products_by_id = {}
+    if promo.get("applicable_categories") or promo.get("applicable_products"):
+        # One $in query for the restriction check; only id and category_id matter
+        pids = [item["product_id"] for item in cart_items if item.get("product_id")]
+        if pids:
+            async for p in db.products.find({"id": {"$in": pids}}, {"_id": 0, "id": 1, "category_id": 1}):
+                products_by_id[p["id"]] = p
+
+    return _validate_promo(promo, subtotal, cart_items, customer_usage, prior_orders, products_by_id)
+
+def _validate_promo(promo: dict, subtotal: float, cart_items: List[dict],
+                    customer_usage: int, prior_orders: int, products_by_id: dict) -> dict:
+    """Pure validation against a pre-fetched promo and pre-fetched counts; raises HTTPException when invalid"""
     # Check expiry date
     if promo.get("expiry_date"):
         expiry = datetime.fromisoformat(promo["expiry_date"].replace('Z', '+00:00'))
         if datetime.now(timezone.utc) > expiry:
             raise HTTPException(status_code=400, detail="Promo code has expired")
-    
+
     # Check minimum order amount
     if promo.get("min_order_amount", 0) > subtotal:
         raise HTTPException(status_code=400, detail=f"Minimum order amount is Rs {promo['min_order_amount']}")
-    
+
     # Check max uses
     if promo.get("max_uses") and promo.get("used_count", 0) >= promo["max_uses"]:
         raise HTTPException(status_code=400, detail="Promo code has reached maximum uses")
-    
+
     # Check max uses per customer
-    if customer_email and promo.get("max_uses_per_customer"):
-        customer_usage = await db.promo_usage.count_documents({
-            "promo_code": code.upper(),
-            "customer_email": customer_email
-        })
-        if customer_usage >= promo["max_uses_per_customer"]:
-            raise HTTPException(status_code=400, detail="You have already used this promo code")
-    
+    if promo.get("max_uses_per_customer") and customer_usage >= promo["max_uses_per_customer"]:
+        raise HTTPException(status_code=400, detail="You have already used this promo code")
+
     # Check first-time buyer restriction
-    if promo.get("first_time_only") and customer_email:
-        previous_orders = await db.orders.count_documents({"customer_email": customer_email})
-        if previous_orders > 0:
-            raise HTTPException(status_code=400, detail="This promo code is only for first-time buyers")
-    
+    if promo.get("first_time_only") and prior_orders > 0:
+        raise HTTPException(status_code=400, detail="This promo code is only for first-time buyers")
+
     # Check category/product restrictions
     if promo.get("applicable_categories") or promo.get("applicable_products"):
         cart_valid = False
         for item in cart_items:
             product_id = item.get("product_id")
-            if product_id:
-                product = await db.products.find_one({"id": product_id})
-                if product:
-                    # Check if product matches
-                    if promo.get("applicable_products") and product_id in promo["applicable_products"]:
-                        cart_valid = True
-                        break
-                    # Check if category matches
-                    if promo.get("applicable_categories") and product.get("category_id") in promo["applicable_categories"]:
-                        cart_valid = True
-                        break
-        
+            product = products_by_id.get(product_id) if product_id else None
+            if product:
+                # Check if product matches
+                if promo.get("applicable_products") and product_id in promo["applicable_products"]:
+                    cart_valid = True
+                    break
+                # Check if category matches
+                if promo.get("applicable_categories") and product.get("category_id") in promo["applicable_categories"]:
+                    cart_valid = True
+                    break
+
         if not cart_valid:
             raise HTTPException(status_code=400, detail="This promo code is not applicable to items in your cart")
-    
+
     # Calculate discount
     discount = 0
     discount_details = {}
@@ -1764,38 +1997,43 @@ async def get_auto_apply_promos(subtotal: float, customer_email: Optional[str] =
         {"expiry_date": {"$gt": now}}
     ]
     
-    promos = await db.promo_codes.find(query, {"_id": 0}).to_list(100)
-    
+    promos = await db.promo_codes.find(query, {"_id": 0}).limit(100).batch_size(100).to_list(100)
+
+    # Batch the per-customer state once instead of re-querying per promo
+    usage_by_code = {}
+    prior_orders = 0
+    if customer_email and promos:
+        codes = [p["code"] for p in promos]
+        usage_rows, prior_orders = await asyncio.gather(
+            db.promo_usage.aggregate([
+                {"$match": {"customer_email": customer_email, "promo_code": {"$in": codes}}},
+                {"$group": {"_id": "$promo_code", "count": {"$sum": 1}}}
+            ]).to_list(len(codes)),
+            db.orders.count_documents({"customer_email": customer_email})
+        )
+        usage_by_code = {row["_id"]: row["count"] for row in usage_rows}
+
     applicable_promos = []
     for promo in promos:
         try:
-            # Validate each promo
-            validation = await validate_promo_code(
-                promo["code"], 
-                subtotal, 
-                [], 
-                customer_email
+            validation = _validate_promo(
+                promo, subtotal, [],
+                usage_by_code.get(promo["code"], 0),
+                prior_orders, {}
             )
             applicable_promos.append({
                 "code": promo["code"],
                 "discount_amount": validation["discount_amount"],
                 "description": validation["details"]["description"]
             })
-        except:
+        except HTTPException:
             continue
-    
+
     return applicable_promos
 
 @api_router.post("/promo-codes/record-usage")
 async def record_promo_usage(promo_code: str, order_id: str, customer_email: Optional[str] = None):
     """Record promo code usage"""
-    # Increment usage count
-    await db.promo_codes.update_one(
-        {"code": promo_code.upper()},
-        {"$inc": {"used_count": 1}}
-    )
-    
-    # Record individual usage
     usage_record = {
         "id": str(uuid.uuid4()),
         "promo_code": promo_code.upper(),
@@ -1803,8 +2041,19 @@ async def record_promo_usage(promo_code: str, order_id: str, customer_email: Opt
         "customer_email": customer_email,
         "used_at": datetime.now(timezone.utc).isoformat()
     }
-    await db.promo_usage.insert_one(usage_record)
-    
+
+    # The counter bump and the usage record live in different collections
+    # and are independent, so write them concurrently
+    await asyncio.gather(
+        db.promo_codes.update_one(
+            {"code": promo_code.upper()},
+            {"$inc": {"used_count": 1}}
+        ),
+        db.promo_usage.insert_one(usage_record)
+    )
+    # used_count feeds the max_uses check, so drop the cached copy
+    _promo_cache.pop(promo_code.upper(), None)
+
     return {"message": "Promo usage recorded"}
 
 
@@ -1842,73 +2091,75 @@ class Bundle(BaseModel):
 @api_router.get("/bundles")
 async def get_bundles():
     """Get all active bundles with populated product details"""
-    bundles = await db.bundles.find({"is_active": True}).sort("sort_order", 1).to_list(100)
-    
-    # Populate product details for each bundle
+    cached = _read_cache.get("bundles")
+    if cached is not None:
+        return cached
+    # Server-side join: $lookup pulls the referenced products in the same
+    # round-trip as the bundles themselves
+    pipeline = [
+        {"$match": {"is_active": True}},
+        {"$sort": {"sort_order": 1}},
+        {"$lookup": {
+            "from": "products",
+            "localField": "products.product_id",
+            "foreignField": "id",
+            "as": "_prods"
+        }},
+        {"$project": {"_id": 0, "_prods._id": 0}}
+    ]
+    bundles = await db.bundles.aggregate(pipeline).to_list(100)
+
     for bundle in bundles:
-        bundle.pop("_id", None)
-        populated_products = []
-        for bp in bundle.get("products", []):
-            product = await db.products.find_one({"id": bp.get("product_id")}, {"_id": 0})
-            if product:
-                populated_products.append({
-                    "product": product,
-                    "variation_id": bp.get("variation_id")
-                })
-        bundle["populated_products"] = populated_products
-    
+        products_by_id = {p["id"]: p for p in bundle.pop("_prods", [])}
+        bundle["populated_products"] = [
+            {"product": products_by_id[bp["product_id"]], "variation_id": bp.get("variation_id")}
+            for bp in bundle.get("products", [])
+            if bp.get("product_id") in products_by_id
+        ]
+
+    _read_cache["bundles"] = bundles
     return bundles
 
 @api_router.get("/bundles/all")
 async def get_all_bundles(current_user: dict = Depends(get_current_user)):
     """Get all bundles for admin"""
-    bundles = await db.bundles.find().sort("sort_order", 1).to_list(100)
-    for b in bundles:
-        b.pop("_id", None)
+    bundles = await db.bundles.find({}, {"_id": 0}).sort("sort_order", 1).to_list(100)
     return bundles
 
 @api_router.post("/bundles")
 async def create_bundle(bundle_data: BundleCreate, current_user: dict = Depends(get_current_user)):
-    slug = bundle_data.name.lower().replace(" ", "-").replace("&", "and")
     discount_pct = round(((bundle_data.original_price - bundle_data.bundle_price) / bundle_data.original_price) * 100, 1) if bundle_data.original_price > 0 else 0
-    
+
+    # Dump the validated input once; it already serializes nested products
+    data = bundle_data.model_dump()
     bundle = Bundle(
-        name=bundle_data.name,
-        slug=slug,
-        description=bundle_data.description,
-        image_url=bundle_data.image_url,
-        products=[p.model_dump() for p in bundle_data.products],
-        original_price=bundle_data.original_price,
-        bundle_price=bundle_data.bundle_price,
-        discount_percentage=discount_pct,
-        is_active=bundle_data.is_active,
-        sort_order=bundle_data.sort_order
+        **data,
+        slug=generate_slug(bundle_data.name),
+        discount_percentage=discount_pct
     )
-    
+
     await db.bundles.insert_one(bundle.model_dump())
+    invalidate_read_cache("bundles")
     result = bundle.model_dump()
     return result
 
 @api_router.put("/bundles/{bundle_id}")
 async def update_bundle(bundle_id: str, bundle_data: BundleCreate, current_user: dict = Depends(get_current_user)):
-    slug = bundle_data.name.lower().replace(" ", "-").replace("&", "and")
     discount_pct = round(((bundle_data.original_price - bundle_data.bundle_price) / bundle_data.original_price) * 100, 1) if bundle_data.original_price > 0 else 0
-    
-    update_data = {
-        "name": bundle_data.name,
-        "slug": slug,
-        "description": bundle_data.description,
-        "image_url": bundle_data.image_url,
-        "products": [p.model_dump() for p in bundle_data.products],
-        "original_price": bundle_data.original_price,
-        "bundle_price": bundle_data.bundle_price,
-        "discount_percentage": discount_pct,
-        "is_active": bundle_data.is_active,
-        "sort_order": bundle_data.sort_order
-    }
-    
-    await db.bundles.update_one({"id": bundle_id}, {"$set": update_data})
-    updated = await db.bundles.find_one({"id": bundle_id}, {"_id": 0})
+
+    update_data = bundle_data.model_dump()
+    update_data["slug"] = generate_slug(bundle_data.name)
+    update_data["discount_percentage"] = discount_pct
+
+    updated = await db.bundles.find_one_and_update(
+        {"id": bundle_id},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated:
+        raise HTTPException(status_code=404, detail="Bundle not found")
+    invalidate_read_cache("bundles")
     return updated
 
 @api_router.delete("/bundles/{bundle_id}")
@@ -1916,6 +2167,7 @@ async def delete_bundle(bundle_id: str, current_user: dict = Depends(get_current
     result = await db.bundles.delete_one({"id": bundle_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Bundle not found")
+    invalidate_read_cache("bundles")
     return {"message": "Bundle deleted"}
 
 # ==================== RECENT PURCHASES (Live Ticker) ====================
@@ -1925,23 +2177,31 @@ import random
 # Nepal cities for random location
 NEPAL_CITIES = ["Kathmandu", "Pokhara", "Lalitpur", "Biratnagar", "Bharatpur", "Birgunj", "Dharan", "Butwal", "Hetauda", "Bhaktapur", "Janakpur", "Nepalgunj", "Itahari", "Dhangadhi", "Tulsipur"]
 
+# Common Nepali first names for the simulated ticker entries
+SIMULATED_NAMES = ["Aarav", "Sita", "Ram", "Gita", "Bikash", "Anita", "Sunil", "Priya", "Rajesh", "Maya", "Dipak", "Sunita", "Anil", "Kamala", "Binod"]
+
+SIMULATED_TIMES_AGO = ["2 min ago", "5 min ago", "8 min ago", "12 min ago", "15 min ago", "20 min ago", "25 min ago", "30 min ago"]
+
 @api_router.get("/recent-purchases")
 async def get_recent_purchases(limit: int = 10):
     """Get recent purchases for live ticker - mix of real orders and simulated"""
     purchases = []
     
     # Get real recent orders (last 24 hours)
-    yesterday = (datetime.now(timezone.utc) - timedelta(hours=24)).isoformat()
+    yesterday = datetime.now(timezone.utc) - timedelta(hours=24)
     real_orders = await db.orders.find(
-        {"created_at": {"$gte": yesterday}},
-        {"_id": 0, "customer_name": 1, "items_text": 1, "created_at": 1}
-    ).sort("created_at", -1).limit(5).to_list(5)
-    
+        {"created_at_dt": {"$gte": yesterday}},
+        {"_id": 0, "masked_first_name": 1, "customer_name": 1, "items_text": 1, "created_at": 1}
+    ).sort("created_at_dt", -1).limit(5).batch_size(5).to_list(5)
+
     for order in real_orders:
-        # Mask customer name for privacy (show first name only)
-        name_parts = order.get("customer_name", "Customer").split()
-        masked_name = name_parts[0] if name_parts else "Customer"
-        
+        # Privacy mask (first name only) is precomputed at order creation;
+        # fall back to splitting for orders written before that
+        masked_name = order.get("masked_first_name")
+        if not masked_name:
+            name_parts = order.get("customer_name", "Customer").split()
+            masked_name = name_parts[0] if name_parts else "Customer"
+
         purchases.append({
             "name": masked_name,
             "location": random.choice(NEPAL_CITIES),
@@ -1953,23 +2213,22 @@ async def get_recent_purchases(limit: int = 10):
     # If we don't have enough real orders, add simulated ones
     if len(purchases) < limit:
         # Get some products for simulation
-        products = await db.products.find({"is_active": True}, {"_id": 0, "name": 1}).limit(20).to_list(20)
+        products = await db.products.find({"is_active": True}, {"_id": 0, "name": 1}).limit(20).batch_size(20).to_list(20)
         product_names = [p["name"] for p in products] if products else ["Netflix Premium", "Spotify Premium", "YouTube Premium"]
-        
-        # Common Nepali first names
-        names = ["Aarav", "Sita", "Ram", "Gita", "Bikash", "Anita", "Sunil", "Priya", "Rajesh", "Maya", "Dipak", "Sunita", "Anil", "Kamala", "Binod"]
-        
-        times_ago = ["2 min ago", "5 min ago", "8 min ago", "12 min ago", "15 min ago", "20 min ago", "25 min ago", "30 min ago"]
-        
-        while len(purchases) < limit:
-            purchases.append({
-                "name": random.choice(names),
-                "location": random.choice(NEPAL_CITIES),
-                "product": random.choice(product_names),
-                "time_ago": random.choice(times_ago),
-                "is_real": False
-            })
-    
+
+        # Draw all samples in one batch per field instead of four
+        # random.choice calls per generated item
+        n = limit - len(purchases)
+        purchases.extend(
+            {"name": name, "location": location, "product": product, "time_ago": time_ago, "is_real": False}
+            for name, location, product, time_ago in zip(
+                random.choices(SIMULATED_NAMES, k=n),
+                random.choices(NEPAL_CITIES, k=n),
+                random.choices(product_names, k=n),
+                random.choices(SIMULATED_TIMES_AGO, k=n)
+            )
+        )
+
     random.shuffle(purchases)
     return purchases[:limit]
 
@@ -1989,36 +2248,31 @@ class WishlistCreate(BaseModel):
 async def get_wishlist(visitor_id: str):
     """Get wishlist items for a visitor"""
     items = await db.wishlists.find({"visitor_id": visitor_id}, {"_id": 0}).to_list(100)
-    
-    # Populate product details
+
+    # Populate product details with a single $in batch fetch
+    ids = {item.get("product_id") for item in items}
+    products_by_id = {}
+    if ids:
+        async for p in db.products.find({"id": {"$in": list(ids)}}, {"_id": 0}):
+            products_by_id[p["id"]] = p
     for item in items:
-        product = await db.products.find_one({"id": item.get("product_id")}, {"_id": 0})
-        item["product"] = product
-    
+        item["product"] = products_by_id.get(item.get("product_id"))
+
     return items
 
 @api_router.post("/wishlist")
 async def add_to_wishlist(data: WishlistCreate):
     """Add item to wishlist"""
-    # Check if already in wishlist
-    existing = await db.wishlists.find_one({
-        "visitor_id": data.visitor_id,
-        "product_id": data.product_id,
-        "variation_id": data.variation_id
-    })
-    
-    if existing:
-        return {"message": "Already in wishlist", "id": existing.get("id")}
-    
-    # Get current price for tracking
-    product = await db.products.find_one({"id": data.product_id})
+    # Get current price for tracking; $elemMatch (or $slice for the default
+    # variation) returns just the one variation instead of the whole product
+    if data.variation_id:
+        projection = {"_id": 0, "variations": {"$elemMatch": {"id": data.variation_id}}}
+    else:
+        # $slice alone keeps every other field, so pair it with an inclusion
+        projection = {"_id": 0, "id": 1, "variations": {"$slice": 1}}
+    product = await db.products.find_one({"id": data.product_id}, projection)
     current_price = None
-    if product and data.variation_id:
-        for v in product.get("variations", []):
-            if v.get("id") == data.variation_id:
-                current_price = v.get("price")
-                break
-    elif product and product.get("variations"):
+    if product and product.get("variations"):
         current_price = product["variations"][0].get("price")
     
     wishlist_item = {
@@ -2031,7 +2285,17 @@ async def add_to_wishlist(data: WishlistCreate):
         "created_at": datetime.now(timezone.utc).isoformat()
     }
     
-    await db.wishlists.insert_one(wishlist_item)
+    # The unique (visitor_id, product_id, variation_id) index detects
+    # duplicates atomically; no find_one pre-check needed
+    try:
+        await db.wishlists.insert_one(wishlist_item)
+    except DuplicateKeyError:
+        existing = await db.wishlists.find_one({
+            "visitor_id": data.visitor_id,
+            "product_id": data.product_id,
+            "variation_id": data.variation_id
+        }, {"_id": 0, "id": 1})
+        return {"message": "Already in wishlist", "id": existing.get("id") if existing else None}
     return {"message": "Added to wishlist", "id": wishlist_item["id"]}
 
 @api_router.delete("/wishlist/{visitor_id}/{product_id}")
@@ -2064,23 +2328,32 @@ class OrderStatusUpdate(BaseModel):
 @api_router.get("/orders/track/{order_id}")
 async def track_order(order_id: str):
     """Public order tracking by order ID or order number"""
-    order = await db.orders.find_one(
-        {"$or": [
-            {"id": order_id}, 
-            {"takeapp_order_id": order_id},
-            {"takeapp_order_number": order_id}
-        ]},
-        {"_id": 0}
+    # Speculatively fetch the history alongside the order; the given id is
+    # almost always the canonical one, so both lookups overlap
+    order, history = await asyncio.gather(
+        db.orders.find_one(
+            {"$or": [
+                {"id": order_id},
+                {"takeapp_order_id": order_id},
+                {"takeapp_order_number": order_id}
+            ]},
+            {"_id": 0}
+        ),
+        db.order_status_history.find(
+            {"order_id": order_id},
+            {"_id": 0}
+        ).sort("created_at", 1).to_list(50)
     )
-    
+
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    
-    # Get status history
-    history = await db.order_status_history.find(
-        {"order_id": order.get("id")},
-        {"_id": 0}
-    ).sort("created_at", 1).to_list(50)
+
+    if order.get("id") != order_id:
+        # Tracked via a Take.app id or order number; re-read under the canonical id
+        history = await db.order_status_history.find(
+            {"order_id": order.get("id")},
+            {"_id": 0}
+        ).sort("created_at", 1).to_list(50)
     
     # Mask sensitive data for public view
     return {
@@ -2135,15 +2408,16 @@ async def update_order_status(order_id: str, status_data: OrderStatusUpdate, cur
 @api_router.get("/orders/{order_id}")
 async def get_order_details(order_id: str, current_user: dict = Depends(get_current_user)):
     """Admin: Get full order details"""
-    order = await db.orders.find_one({"id": order_id}, {"_id": 0})
+    order, history = await asyncio.gather(
+        db.orders.find_one({"id": order_id}, {"_id": 0}),
+        db.order_status_history.find(
+            {"order_id": order_id},
+            {"_id": 0}
+        ).sort("created_at", 1).to_list(50)
+    )
     if not order:
         raise HTTPException(status_code=404, detail="Order not found")
-    
-    history = await db.order_status_history.find(
-        {"order_id": order_id},
-        {"_id": 0}
-    ).sort("created_at", 1).to_list(50)
-    
+
     order["status_history"] = history
     return order
 
@@ -2153,55 +2427,44 @@ async def get_order_details(order_id: str, current_user: dict = Depends(get_curr
 async def get_analytics_overview(current_user: dict = Depends(get_current_user)):
     """Get overview analytics for admin dashboard"""
     now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-    week_ago = (now - timedelta(days=7)).isoformat()
-    month_ago = (now - timedelta(days=30)).isoformat()
-    
-    # Today's stats
-    today_orders = await db.orders.count_documents({"created_at": {"$gte": today_start}})
-    today_revenue_cursor = await db.orders.aggregate([
-        {"$match": {"created_at": {"$gte": today_start}, "status": {"$ne": "cancelled"}}},
-        {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
-    ]).to_list(1)
-    today_revenue = today_revenue_cursor[0]["total"] if today_revenue_cursor else 0
-    
-    # This week stats
-    week_orders = await db.orders.count_documents({"created_at": {"$gte": week_ago}})
-    week_revenue_cursor = await db.orders.aggregate([
-        {"$match": {"created_at": {"$gte": week_ago}, "status": {"$ne": "cancelled"}}},
-        {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
-    ]).to_list(1)
-    week_revenue = week_revenue_cursor[0]["total"] if week_revenue_cursor else 0
-    
-    # This month stats
-    month_orders = await db.orders.count_documents({"created_at": {"$gte": month_ago}})
-    month_revenue_cursor = await db.orders.aggregate([
-        {"$match": {"created_at": {"$gte": month_ago}, "status": {"$ne": "cancelled"}}},
-        {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
-    ]).to_list(1)
-    month_revenue = month_revenue_cursor[0]["total"] if month_revenue_cursor else 0
-    
-    # All time stats
-    total_orders = await db.orders.count_documents({})
-    total_revenue_cursor = await db.orders.aggregate([
-        {"$match": {"status": {"$ne": "cancelled"}}},
-        {"$group": {"_id": None, "total": {"$sum": "$total_amount"}}}
-    ]).to_list(1)
-    total_revenue = total_revenue_cursor[0]["total"] if total_revenue_cursor else 0
-    
-    # Product & category counts
-    total_products = await db.products.count_documents({"is_active": True})
-    total_categories = await db.categories.count_documents({})
-    total_reviews = await db.reviews.count_documents({})
-    
-    # Wishlist count
-    total_wishlists = await db.wishlists.count_documents({})
-    
+    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    week_ago = now - timedelta(days=7)
+    month_ago = now - timedelta(days=30)
+    
+    # One $facet pass over orders computes all four periods; order counts
+    # include cancelled orders (as before) while revenue excludes them via $cond
+    group_stage = {"$group": {
+        "_id": None,
+        "orders": {"$sum": 1},
+        "revenue": {"$sum": {"$cond": [{"$ne": ["$status", "cancelled"]}, "$total_amount", 0]}}
+    }}
+    facet_pipeline = [{"$facet": {
+        "today": [{"$match": {"created_at_dt": {"$gte": today_start}}}, group_stage],
+        "week": [{"$match": {"created_at_dt": {"$gte": week_ago}}}, group_stage],
+        "month": [{"$match": {"created_at_dt": {"$gte": month_ago}}}, group_stage],
+        "all_time": [group_stage]
+    }}]
+
+    facets, total_products, total_categories, total_reviews, total_wishlists = await asyncio.gather(
+        db.orders.aggregate(facet_pipeline).to_list(1),
+        db.products.count_documents({"is_active": True}),
+        db.categories.count_documents({}),
+        db.reviews.count_documents({}),
+        db.wishlists.count_documents({})
+    )
+
+    def period_stats(branch):
+        if branch:
+            return {"orders": branch[0]["orders"], "revenue": branch[0]["revenue"]}
+        return {"orders": 0, "revenue": 0}
+
+    facet_result = facets[0] if facets else {}
+
     return {
-        "today": {"orders": today_orders, "revenue": today_revenue},
-        "week": {"orders": week_orders, "revenue": week_revenue},
-        "month": {"orders": month_orders, "revenue": month_revenue},
-        "all_time": {"orders": total_orders, "revenue": total_revenue},
+        "today": period_stats(facet_result.get("today")),
+        "week": period_stats(facet_result.get("week")),
+        "month": period_stats(facet_result.get("month")),
+        "all_time": period_stats(facet_result.get("all_time")),
         "counts": {
             "products": total_products,
             "categories": total_categories,
@@ -2211,10 +2474,13 @@ async def get_analytics_overview(current_user: dict = Depends(get_current_user))
     }
 
 @api_router.get("/analytics/top-products")
-async def get_top_products(current_user: dict = Depends(get_current_user), limit: int = 10):
-    """Get top selling products"""
-    # Aggregate orders to find top products
+async def get_top_products(current_user: dict = Depends(get_current_user), limit: int = 10, days: int = 90):
+    """Get top selling products within a recent window (default 90 days)"""
+    start_date = datetime.now(timezone.utc) - timedelta(days=days)
+
+    # $match first so the created_at_dt index prunes orders before the unwind
     pipeline = [
+        {"$match": {"created_at_dt": {"$gte": start_date}, "status": {"$ne": "cancelled"}}},
         {"$unwind": "$items"},
         {"$group": {
             "_id": "$items.name",
@@ -2240,40 +2506,32 @@ async def get_top_products(current_user: dict = Depends(get_current_user), limit
 async def get_revenue_chart(current_user: dict = Depends(get_current_user), days: int = 30):
     """Get daily revenue for chart"""
     now = datetime.now(timezone.utc)
-    start_date = (now - timedelta(days=days)).isoformat()
-    
+    start_date = now - timedelta(days=days)
+
     pipeline = [
-        {"$match": {"created_at": {"$gte": start_date}, "status": {"$ne": "cancelled"}}},
-        {"$addFields": {
-            "date": {"$substr": ["$created_at", 0, 10]}
-        }},
+        {"$match": {"created_at_dt": {"$gte": start_date}, "status": {"$ne": "cancelled"}}},
+        # Group on the BSON Date truncated to day; no string slicing involved
         {"$group": {
-            "_id": "$date",
+            "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$created_at_dt"}},
             "orders": {"$sum": 1},
             "revenue": {"$sum": "$total_amount"}
-        }},
-        {"$sort": {"_id": 1}}
+        }}
     ]
-    
-    daily_data = await db.orders.aggregate(pipeline).to_list(days)
-    
-    # Fill in missing dates with zero values
-    result = []
-    current = now - timedelta(days=days)
+
+    daily_data = await db.orders.aggregate(pipeline).to_list(days + 1)
     data_map = {d["_id"]: d for d in daily_data}
-    
+
+    # Fill in missing dates with zero values in a single pass
+    start = now - timedelta(days=days)
+    result = []
     for i in range(days + 1):
-        date_str = current.strftime("%Y-%m-%d")
-        if date_str in data_map:
-            result.append({
-                "date": date_str,
-                "orders": data_map[date_str]["orders"],
-                "revenue": data_map[date_str]["revenue"]
-            })
-        else:
-            result.append({"date": date_str, "orders": 0, "revenue": 0})
-        current += timedelta(days=1)
-    
+        date_str = (start + timedelta(days=i)).strftime("%Y-%m-%d")
+        day = data_map.get(date_str)
+        result.append({
+            "date": date_str,
+            "orders": day["orders"] if day else 0,
+            "revenue": day["revenue"] if day else 0
+        })
     return result
 
 @api_router.get("/analytics/order-status")
@@ -2295,78 +2553,106 @@ async def get_order_status_breakdown(current_user: dict = Depends(get_current_us
 
 # ==================== SEO / SITEMAP ====================
 
-from fastapi.responses import Response
+# Static sitemap entries
+_SITEMAP_STATIC_PAGES = [
+    {"loc": "/", "priority": "1.0", "changefreq": "daily"},
+    {"loc": "/about", "priority": "0.7", "changefreq": "monthly"},
+    {"loc": "/faq", "priority": "0.6", "changefreq": "monthly"},
+    {"loc": "/terms", "priority": "0.5", "changefreq": "monthly"},
+    {"loc": "/blog", "priority": "0.8", "changefreq": "weekly"},
+]
+
+# Crawler traffic is bursty, so serve a pre-gzipped sitemap for 5 minutes
+_SITEMAP_TTL = 300
+_sitemap_cache = {"ts": 0.0, "gz": b""}
 
 @api_router.get("/sitemap.xml")
 async def get_sitemap():
     """Generate dynamic sitemap for SEO"""
+    if time() - _sitemap_cache["ts"] < _SITEMAP_TTL:
+        return Response(
+            content=_sitemap_cache["gz"],
+            media_type="application/xml",
+            headers={"Content-Encoding": "gzip"}
+        )
+
     base_url = os.environ.get("SITE_URL", "https://gameshopnepal.com")
-    
-    # Static pages
-    static_pages = [
-        {"loc": "/", "priority": "1.0", "changefreq": "daily"},
-        {"loc": "/about", "priority": "0.7", "changefreq": "monthly"},
-        {"loc": "/faq", "priority": "0.6", "changefreq": "monthly"},
-        {"loc": "/terms", "priority": "0.5", "changefreq": "monthly"},
-        {"loc": "/blog", "priority": "0.8", "changefreq": "weekly"},
+
+    # The three collections are independent, fetch them concurrently
+    products, blog_posts, categories = await asyncio.gather(
+        db.products.find({"is_active": True}, {"slug": 1}).limit(1000).batch_size(1000).to_list(1000),
+        db.blog_posts.find({"is_published": True}, {"slug": 1}).limit(100).batch_size(100).to_list(100),
+        db.categories.find({}, {"slug": 1}).limit(100).batch_size(100).to_list(100)
+    )
+
+    # Build via join instead of repeated string concatenation
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
     ]
-    
-    # Get all active products
-    products = await db.products.find({"is_active": True}, {"slug": 1}).to_list(1000)
-    
-    # Get all published blog posts
-    blog_posts = await db.blog_posts.find({"is_published": True}, {"slug": 1}).to_list(100)
-    
-    # Get all categories
-    categories = await db.categories.find({}, {"slug": 1}).to_list(100)
-    
-    # Build sitemap XML
-    xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    xml_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    
-    # Add static pages
-    for page in static_pages:
-        xml_content += f'''  <url>
+
+    for page in _SITEMAP_STATIC_PAGES:
+        parts.append(f'''  <url>
     <loc>{base_url}{page["loc"]}</loc>
     <changefreq>{page["changefreq"]}</changefreq>
     <priority>{page["priority"]}</priority>
-  </url>\n'''
-    
-    # Add products
+  </url>\n''')
+
     for product in products:
         if product.get("slug"):
-            xml_content += f'''  <url>
+            parts.append(f'''  <url>
     <loc>{base_url}/product/{product["slug"]}</loc>
     <changefreq>weekly</changefreq>
     <priority>0.9</priority>
-  </url>\n'''
-    
-    # Add blog posts
+  </url>\n''')
+
     for post in blog_posts:
         if post.get("slug"):
-            xml_content += f'''  <url>
+            parts.append(f'''  <url>
     <loc>{base_url}/blog/{post["slug"]}</loc>
     <changefreq>monthly</changefreq>
     <priority>0.7</priority>
-  </url>\n'''
-    
-    xml_content += '</urlset>'
-    
-    return Response(content=xml_content, media_type="application/xml")
+  </url>\n''')
+
+    parts.append('</urlset>')
+
+    gz = gzip.compress("".join(parts).encode())
+    _sitemap_cache["gz"] = gz
+    _sitemap_cache["ts"] = time()
+
+    return Response(content=gz, media_type="application/xml", headers={"Content-Encoding": "gzip"})
+
+# Bound .format methods: one interpolation call per field, no per-request
+# f-string rebuilds of the static text
+_SEO_PRODUCT_TITLE = "{name} - Buy Online | GameShop Nepal".format
+_SEO_PRODUCT_DESCRIPTION = "Buy {name} at the best price in Nepal. Starting from Rs {min_price}. Instant delivery, 100% genuine products.".format
+_SEO_PRODUCT_KEYWORDS = "{name}, buy {name} Nepal, {name} price Nepal, digital products Nepal".format
+_SEO_BLOG_TITLE = "{title} | GameShop Nepal Blog".format
+_SEO_BLOG_KEYWORDS = "{title}, gaming blog Nepal, digital products guide".format
+
+_SEO_DEFAULT_META = {
+    "title": "GameShop Nepal - Digital Products at Best Prices",
+    "description": "Buy Netflix, Spotify, YouTube Premium, PUBG UC and more at the best prices in Nepal. Instant delivery, 100% genuine products.",
+    "keywords": "digital products Nepal, Netflix Nepal, Spotify Nepal, gaming topup Nepal"
+}
 
 @api_router.get("/seo/meta/{page_type}/{slug}")
 async def get_seo_meta(page_type: str, slug: str):
     """Get SEO meta data for a specific page"""
     if page_type == "product":
-        product = await db.products.find_one({"slug": slug}, {"_id": 0})
+        # $min computes the lowest variation price server-side, so the
+        # projection skips the variations array entirely
+        product = await db.products.find_one({"slug": slug}, {
+            "_id": 0, "name": 1, "description": 1, "image_url": 1,
+            "is_sold_out": 1, "min_price": {"$min": "$variations.price"}
+        })
         if product:
-            # Get lowest price from variations
-            min_price = min([v.get("price", 0) for v in product.get("variations", [])]) if product.get("variations") else 0
-            
+            min_price = product.get("min_price") or 0
+
             return {
-                "title": f"{product['name']} - Buy Online | GameShop Nepal",
-                "description": f"Buy {product['name']} at the best price in Nepal. Starting from Rs {min_price}. Instant delivery, 100% genuine products.",
-                "keywords": f"{product['name']}, buy {product['name']} Nepal, {product['name']} price Nepal, digital products Nepal",
+                "title": _SEO_PRODUCT_TITLE(name=product["name"]),
+                "description": _SEO_PRODUCT_DESCRIPTION(name=product["name"], min_price=min_price),
+                "keywords": _SEO_PRODUCT_KEYWORDS(name=product["name"]),
                 "og_image": product.get("image_url"),
                 "schema": {
                     "@context": "https://schema.org",
@@ -2384,12 +2670,14 @@ async def get_seo_meta(page_type: str, slug: str):
             }
     
     elif page_type == "blog":
-        post = await db.blog_posts.find_one({"slug": slug}, {"_id": 0})
+        post = await db.blog_posts.find_one({"slug": slug}, {
+            "_id": 0, "title": 1, "excerpt": 1, "content": 1, "image_url": 1, "created_at": 1
+        })
         if post:
             return {
-                "title": f"{post['title']} | GameShop Nepal Blog",
+                "title": _SEO_BLOG_TITLE(title=post["title"]),
                 "description": post.get("excerpt", post.get("content", "")[:160]),
-                "keywords": f"{post['title']}, gaming blog Nepal, digital products guide",
+                "keywords": _SEO_BLOG_KEYWORDS(title=post["title"]),
                 "og_image": post.get("image_url"),
                 "schema": {
                     "@context": "https://schema.org",
@@ -2403,11 +2691,7 @@ async def get_seo_meta(page_type: str, slug: str):
             }
     
     # Default meta
-    return {
-        "title": "GameShop Nepal - Digital Products at Best Prices",
-        "description": "Buy Netflix, Spotify, YouTube Premium, PUBG UC and more at the best prices in Nepal. Instant delivery, 100% genuine products.",
-        "keywords": "digital products Nepal, Netflix Nepal, Spotify Nepal, gaming topup Nepal"
-    }
+    return _SEO_DEFAULT_META
 
 # ==================== CUSTOMER ACCOUNTS ====================
 
@@ -2422,43 +2706,64 @@ class CustomerProfile(BaseModel):
 @api_router.post("/customers/login")
 async def customer_login(data: CustomerLogin):
     """Login/Register customer by phone number - sends OTP or validates"""
-    phone = data.phone.strip().replace(" ", "").replace("-", "")
-    
-    # Find or create customer
-    customer = await db.customers.find_one({"phone": phone})
-    
+    phone = normalize_phone(data.phone)
+
     if not data.otp:
+        # Cap OTP sends per phone: each send is a Mongo write (and an SMS in
+        # production), so don't let one number drain either
+        if not rate_limit_check(f"otp:{phone}", limit=5, window=3600):
+            raise HTTPException(status_code=429, detail="Too many OTP requests. Please try again later.")
+
         # Generate OTP (in production, send via SMS)
-        import random
-        otp = str(random.randint(100000, 999999))
-        
-        if customer:
-            await db.customers.update_one({"phone": phone}, {"$set": {"otp": otp, "otp_expires": (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat()}})
-        else:
-            await db.customers.insert_one({
-                "id": str(uuid.uuid4()),
-                "phone": phone,
-                "name": None,
-                "email": None,
-                "otp": otp,
-                "otp_expires": (datetime.now(timezone.utc) + timedelta(minutes=10)).isoformat(),
-                "created_at": datetime.now(timezone.utc).isoformat(),
-                "total_orders": 0,
-                "total_spent": 0
-            })
-        
+        otp = generate_otp()
+
+        # BSON Date, so expiry checks compare datetimes instead of ISO strings
+        otp_expires = datetime.now(timezone.utc) + timedelta(minutes=10)
+
+        # One atomic upsert replaces find_one + update/insert, and closes the
+        # race where two concurrent first logins for a phone both insert
+        await db.customers.update_one(
+            {"phone": phone},
+            {
+                "$set": {"otp": hash_otp(otp), "otp_expires": otp_expires},
+                "$setOnInsert": {
+                    "id": str(uuid.uuid4()),
+                    "name": None,
+                    "email": None,
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                    "total_orders": 0,
+                    "total_spent": 0
+                }
+            },
+            upsert=True
+        )
+
         # In production, send OTP via SMS. For now, return it (dev mode)
         return {"message": "OTP sent", "dev_otp": otp}  # Remove dev_otp in production
-    
+
     else:
         # Validate OTP
+        customer = await db.customers.find_one({"phone": phone})
         if not customer:
             raise HTTPException(status_code=404, detail="Customer not found")
         
-        if customer.get("otp") != data.otp:
+        stored_otp = customer.get("otp")
+        if isinstance(stored_otp, str):
+            # Legacy records stored the code in plaintext
+            otp_valid = hmac.compare_digest(stored_otp, data.otp)
+        else:
+            otp_valid = stored_otp is not None and hmac.compare_digest(bytes(stored_otp), hash_otp(data.otp))
+        if not otp_valid:
             raise HTTPException(status_code=400, detail="Invalid OTP")
         
-        if customer.get("otp_expires") and customer["otp_expires"] < datetime.now(timezone.utc).isoformat():
+        expires = customer.get("otp_expires")
+        if isinstance(expires, str):
+            # Legacy records stored ISO strings; parse before comparing
+            expires = datetime.fromisoformat(expires)
+        if expires is not None and expires.tzinfo is None:
+            # PyMongo returns BSON Dates as naive UTC datetimes
+            expires = expires.replace(tzinfo=timezone.utc)
+        if expires and expires < datetime.now(timezone.utc):
             raise HTTPException(status_code=400, detail="OTP expired")
         
         # Clear OTP and generate token
@@ -2466,8 +2771,8 @@ async def customer_login(data: CustomerLogin):
         
         token = jwt.encode(
             {"customer_id": customer["id"], "phone": phone, "exp": datetime.now(timezone.utc) + timedelta(days=30)},
-            JWT_SECRET,
-            algorithm="HS256"
+            _JWT_KEY,
+            algorithm=JWT_ALGORITHM
         )
         
         return {
@@ -2480,17 +2785,63 @@ async def customer_login(data: CustomerLogin):
             }
         }
 
+def _token_expired(token: str) -> bool:
+    """Cheap expiry pre-check on the unverified payload, before any HMAC.
+
+    Logged-out tabs and scrapers keep retrying long-expired tokens; reading
+    exp straight from the base64 payload rejects those without paying for
+    signature verification. Returns False on any parse problem so jwt.decode
+    stays the authority on malformed tokens.
+    """
+    try:
+        segment = token.split(".")[1]
+        payload = orjson.loads(base64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4)))
+        return payload.get("exp", float("inf")) < time()
+    except Exception:
+        return False
+
+async def get_current_customer_id(authorization: str = Header(None)) -> dict:
+    """Verify the token and return its claims, skipping the customer lookup.
+
+    The login token already carries customer_id and phone, which is all the
+    order-history path consumes; use get_current_customer where the full
+    profile document is actually needed.
+    """
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Not authenticated")
+
+    token = authorization.replace("Bearer ", "")
+    if _token_expired(token):
+        raise HTTPException(status_code=401, detail="Token expired")
+    try:
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
+        return {"customer_id": payload["customer_id"], "phone": payload["phone"]}
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expired")
+    except jwt.InvalidTokenError:
+        raise HTTPException(status_code=401, detail="Invalid token")
+
 async def get_current_customer(authorization: str = Header(None)):
     """Dependency to get current logged-in customer"""
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Not authenticated")
     
     token = authorization.replace("Bearer ", "")
+    if _token_expired(token):
+        raise HTTPException(status_code=401, detail="Token expired")
+    cache_key = _token_cache_key(token)
+    cached = _jwt_cache.get(cache_key)
+    if cached is not None:
+        customer, exp = cached
+        if exp > time():
+            return customer
+        _jwt_cache.pop(cache_key, None)
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGORITHMS)
         customer = await db.customers.find_one({"id": payload["customer_id"]}, {"_id": 0, "otp": 0, "otp_expires": 0})
         if not customer:
             raise HTTPException(status_code=401, detail="Customer not found")
+        _jwt_cache[cache_key] = (customer, payload["exp"])
         return customer
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -2513,82 +2864,158 @@ async def update_customer_profile(profile: CustomerProfile, customer: dict = Dep
     
     if update_data:
         await db.customers.update_one({"id": customer["id"]}, {"$set": update_data})
-    
+        invalidate_customer_cache(customer["id"])
+
     updated = await db.customers.find_one({"id": customer["id"]}, {"_id": 0, "otp": 0, "otp_expires": 0})
     return updated
 
+# Short private caching for the polled account/admin listings: a weak ETag
+# lets clients revalidate for free when the page hasn't changed
+_CUSTOMER_CACHE_CONTROL = "private, max-age=30"
+
+def _page_etag(rows: list, skip: int, limit: int) -> str:
+    """Weak validator for a created_at-sorted page: newest row plus page shape"""
+    newest = rows[0].get("created_at", "") if rows else ""
+    digest = hashlib.blake2b(f"{len(rows)}:{newest}:{skip}:{limit}".encode(), digest_size=8).hexdigest()
+    return f'W/"{digest}"'
+
 @api_router.get("/customers/me/orders")
-async def get_customer_orders(customer: dict = Depends(get_current_customer)):
+async def get_customer_orders(
+    request: Request,
+    claims: dict = Depends(get_current_customer_id),
+    limit: int = Query(50, ge=1, le=100),
+    skip: int = Query(0, ge=0),
+):
     """Get customer's order history"""
     # Find orders by phone number
     orders = await db.orders.find(
-        {"customer_phone": customer["phone"]},
-        {"_id": 0}
-    ).sort("created_at", -1).to_list(100)
-    
-    return orders
+        {"customer_phone": claims["phone"]},
+        # List view: skip the bulky items_text/screenshot/internal fields
+        {"_id": 0, "id": 1, "items": 1, "total_amount": 1, "status": 1,
+         "payment_method": 1, "created_at": 1}
+    ).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+
+    etag = _page_etag(orders, skip, limit)
+    headers = {"ETag": etag, "Cache-Control": _CUSTOMER_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(orders, headers=headers)
+
+TAKEAPP_API_KEY = os.environ.get("TAKEAPP_API_KEY", "")
+TAKEAPP_BASE_URL = os.environ.get("TAKEAPP_BASE_URL", "https://api.take.app/v1")
+TAKEAPP_SYNC_BATCH_SIZE = 500
+
+# Bounds how many sync batches may hold Mongo connections at once, so a long
+# sync never starves the pool for interactive traffic
+_sync_write_sem = asyncio.Semaphore(16)
+
+class _AsyncByteStreamReader:
+    """File-like adapter so ijson can parse an httpx byte stream incrementally."""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size=-1):
+        if size == 0:
+            # ijson probes with read(0) to detect a bytes (vs str) stream
+            return b""
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
 
 @api_router.post("/customers/sync-from-takeapp")
 async def sync_customers_from_takeapp(current_user: dict = Depends(get_current_user)):
     """Admin: Sync customer data from Take.app orders"""
     if not TAKEAPP_API_KEY:
         raise HTTPException(status_code=400, detail="Take.app API key not configured")
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{TAKEAPP_BASE_URL}/orders?api_key={TAKEAPP_API_KEY}")
+
+    now_iso = datetime.now(timezone.utc).isoformat()
+    pending = {}  # phone -> deltas summed across that customer's orders
+    synced_count = 0
+    total_orders = 0
+
+    async def flush_pending():
+        nonlocal synced_count
+        ops = []
+        for phone, agg in pending.items():
+            set_fields = {"last_order_at": agg["last"] or now_iso}
+            insert_fields = {
+                "id": str(uuid.uuid4()),
+                "created_at": now_iso,
+                "source": "takeapp"
+            }
+            # Only overwrite name/email when some order actually carried them,
+            # so existing customer details survive sparse Take.app records.
+            for field in ("name", "email"):
+                if agg[field]:
+                    set_fields[field] = agg[field]
+                else:
+                    insert_fields[field] = None
+            ops.append(UpdateOne(
+                {"phone": phone},
+                {
+                    "$inc": {"total_orders": agg["count"], "total_spent": agg["spent"]},
+                    "$set": set_fields,
+                    "$setOnInsert": insert_fields
+                },
+                upsert=True
+            ))
+        async with _sync_write_sem:
+            result = await db.customers.bulk_write(ops, ordered=False)
+        synced_count += result.upserted_count
+        pending.clear()
+
+    async with http_client.stream("GET", f"{TAKEAPP_BASE_URL}/orders?api_key={TAKEAPP_API_KEY}") as response:
         if response.status_code != 200:
             raise HTTPException(status_code=500, detail="Failed to fetch Take.app orders")
-        
-        orders = response.json()
-        synced_count = 0
-        
-        for order in orders:
+
+        # Parse orders as they arrive instead of buffering the whole payload,
+        # pre-summing per customer so repeat buyers cost one upsert instead of
+        # one per order; flush in batches so peak memory stays O(batch) and
+        # the first writes overlap the download tail.
+        async for order in ijson.items_async(_AsyncByteStreamReader(response.aiter_bytes()), "item"):
+            total_orders += 1
             phone = order.get("customer_phone") or order.get("phone")
             if not phone:
                 continue
-            
-            phone = phone.strip().replace(" ", "").replace("-", "")
-            
-            # Find or create customer
-            existing = await db.customers.find_one({"phone": phone})
-            
-            order_amount = float(order.get("total", 0) or 0)
-            
-            if existing:
-                # Update stats
-                await db.customers.update_one(
-                    {"phone": phone},
-                    {
-                        "$inc": {"total_orders": 1, "total_spent": order_amount},
-                        "$set": {
-                            "name": order.get("customer_name") or existing.get("name"),
-                            "email": order.get("customer_email") or existing.get("email"),
-                            "last_order_at": order.get("created_at") or datetime.now(timezone.utc).isoformat()
-                        }
-                    }
-                )
-            else:
-                # Create new customer
-                await db.customers.insert_one({
-                    "id": str(uuid.uuid4()),
-                    "phone": phone,
-                    "name": order.get("customer_name"),
-                    "email": order.get("customer_email"),
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "total_orders": 1,
-                    "total_spent": order_amount,
-                    "last_order_at": order.get("created_at"),
-                    "source": "takeapp"
-                })
-                synced_count += 1
-        
-        return {"message": f"Synced {synced_count} new customers from Take.app", "total_orders_processed": len(orders)}
+
+            phone = normalize_phone(phone)
+            agg = pending.setdefault(phone, {"count": 0, "spent": 0.0, "last": None, "name": None, "email": None})
+            agg["count"] += 1
+            agg["spent"] += float(order.get("total", 0) or 0)
+            agg["last"] = order.get("created_at") or agg["last"]
+            agg["name"] = order.get("customer_name") or agg["name"]
+            agg["email"] = order.get("customer_email") or agg["email"]
+
+            if len(pending) >= TAKEAPP_SYNC_BATCH_SIZE:
+                await flush_pending()
+
+    if pending:
+        await flush_pending()
+
+    return {"message": f"Synced {synced_count} new customers from Take.app", "total_orders_processed": total_orders}
 
 @api_router.get("/customers")
-async def get_all_customers(current_user: dict = Depends(get_current_user)):
+async def get_all_customers(
+    request: Request,
+    current_user: dict = Depends(get_current_user),
+    limit: int = Query(50, ge=1, le=200),
+    skip: int = Query(0, ge=0),
+):
     """Admin: Get all customers"""
-    customers = await db.customers.find({}, {"_id": 0, "otp": 0, "otp_expires": 0}).sort("created_at", -1).to_list(1000)
-    return customers
+    customers = await db.customers.find(
+        {},
+        # Exactly what the admin table and CSV export render
+        {"_id": 0, "id": 1, "phone": 1, "name": 1, "email": 1, "total_orders": 1,
+         "total_spent": 1, "created_at": 1, "last_order_at": 1, "source": 1}
+    ).sort("created_at", -1).skip(skip).limit(limit).to_list(limit)
+
+    etag = _page_etag(customers, skip, limit)
+    headers = {"ETag": etag, "Cache-Control": _CUSTOMER_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(customers, headers=headers)
 
 # ==================== ROOT ====================
 
@@ -2608,6 +3035,89 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def create_http_client():
+    global http_client
+    http_client = httpx.AsyncClient(
+        timeout=15.0,
+        limits=httpx.Limits(max_keepalive_connections=32, max_connections=128)
+    )
+
+@app.on_event("startup")
+async def start_periodic_trustpilot_sync():
+    global _trustpilot_sync_task
+    _trustpilot_sync_task = asyncio.create_task(_periodic_trustpilot_sync())
+
+@app.on_event("startup")
+async def ensure_indexes():
+    """Create indexes used by hot query paths (no-ops if they already exist)."""
+    # TTL index: Mongo expires OTP records itself, so no delete_many per send
+    await db.otp_records.create_index("expires_at", expireAfterSeconds=0)
+    await db.otp_records.create_index("email")
+    # Seed the sort_order counters from existing data on first run so new
+    # documents keep appending after whatever is already there
+    for counter_key, collection in (("products", db.products), ("faqs", db.faqs)):
+        if await db.counters.find_one({"_id": counter_key}) is None:
+            max_doc = await collection.find_one(sort=[("sort_order", -1)])
+            seq = (max_doc.get("sort_order", 0) + 1) if max_doc else 0
+            await db.counters.update_one(
+                {"_id": counter_key}, {"$setOnInsert": {"seq": seq}}, upsert=True
+            )
+    # Dedupe key for Trustpilot review upserts
+    await db.reviews.create_index(
+        [("reviewer_name", 1), ("comment", 1), ("source", 1)],
+        unique=True,
+        partialFilterExpression={"source": "trustpilot"}
+    )
+    # Listing endpoints: make their filter+sort patterns index-driven
+    await db.reviews.create_index([("review_date", -1)])
+    await db.faqs.create_index([("sort_order", 1)])
+    await db.payment_methods.create_index([("is_active", 1), ("sort_order", 1)])
+    await db.blog_posts.create_index([("is_published", 1), ("created_at", -1)])
+    await db.orders.create_index([("created_at", -1)])
+    await db.orders.create_index([("created_at_dt", -1)])
+    # Backfill the BSON Date twin of created_at for orders written before
+    # the dual-write; onError leaves unparseable legacy values null
+    await db.orders.update_many(
+        {"created_at_dt": {"$exists": False}, "created_at": {"$type": "string"}},
+        [{"$set": {"created_at_dt": {
+            "$dateFromString": {"dateString": "$created_at", "onError": None}
+        }}}]
+    )
+    # Unique lookup keys (partial on products.slug since legacy docs may lack one)
+    await db.products.create_index(
+        "slug", unique=True, partialFilterExpression={"slug": {"$type": "string"}}
+    )
+    await db.blog_posts.create_index("slug", unique=True)
+    await db.promo_codes.create_index("code", unique=True)
+    # Promo validation and auto-apply batch lookups
+    await db.promo_usage.create_index([("promo_code", 1), ("customer_email", 1)])
+    await db.orders.create_index([("customer_email", 1)])
+    # Wishlist: per-visitor listing plus a natural dedupe key
+    await db.wishlists.create_index(
+        [("visitor_id", 1), ("product_id", 1), ("variation_id", 1)], unique=True
+    )
+    # Order tracking reads history per order in insertion order
+    await db.order_status_history.create_index([("order_id", 1), ("created_at", 1)])
+    # Customer accounts: login/sync upserts key on phone, token auth on id,
+    # the admin listing sorts by created_at, and order history filters by
+    # phone + sorts newest-first
+    await db.customers.create_index(
+        "phone", unique=True, partialFilterExpression={"phone": {"$type": "string"}}
+    )
+    await db.customers.create_index("id", unique=True)
+    await db.customers.create_index([("created_at", -1)])
+    await db.orders.create_index([("customer_phone", 1), ("created_at", -1)])
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if _trustpilot_sync_task is not None:
+        _trustpilot_sync_task.cancel()
+    if http_client is not None:
+        await http_client.aclose()
     client.close()
+
+if __name__ == "__main__":
+    import uvicorn
+    # uvloop + httptools speed up every await against Motor/httpx/SMTP
+    uvicorn.run("server:app", host="0.0.0.0", port=8001, loop="uvloop", http="httptools")
@@ -1,20 +1,24 @@
 #!/usr/bin/env python3
 
-import requests
+import asyncio
 import sys
-import json
 from datetime import datetime
 
+import httpx
+import orjson
+
 class GameShopNepalAPITester:
     def __init__(self, base_url="https://gamemart-16.preview.emergentagent.com"):
         self.base_url = base_url
+        # One pooled client for the whole run, so tests reuse TCP/TLS connections
+        self.client = httpx.AsyncClient(timeout=30)
         self.token = None
         self.tests_run = 0
         self.tests_passed = 0
         self.failed_tests = []
         self.passed_tests = []
 
-    def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
+    async def run_test(self, name, method, endpoint, expected_status, data=None, headers=None):
         """Run a single API test"""
         url = f"{self.base_url}/api/{endpoint}"
         test_headers = {'Content-Type': 'application/json'}
@@ -30,35 +34,30 @@ class GameShopNepalAPITester:
         print(f"   URL: {url}")
         
         try:
-            if method == 'GET':
-                response = requests.get(url, headers=test_headers, timeout=30)
-            elif method == 'POST':
-                response = requests.post(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'PUT':
-                response = requests.put(url, json=data, headers=test_headers, timeout=30)
-            elif method == 'DELETE':
-                response = requests.delete(url, headers=test_headers, timeout=30)
+            response = await self.client.request(method, url, json=data, headers=test_headers)
 
             success = response.status_code == expected_status
+            # Read the raw body once; decode with orjson only when needed
+            body = response.content
             
             if success:
                 self.tests_passed += 1
                 self.passed_tests.append(name)
                 print(f"✅ PASSED - Status: {response.status_code}")
                 try:
-                    response_data = response.json()
-                    return True, response_data
+                    return True, orjson.loads(body)
                 except:
                     return True, {}
             else:
+                preview = body[:200].decode("utf-8", "replace") if body else "No response"
                 self.failed_tests.append({
                     "test": name,
                     "expected": expected_status,
                     "actual": response.status_code,
-                    "response": response.text[:200] if response.text else "No response"
+                    "response": preview
                 })
                 print(f"❌ FAILED - Expected {expected_status}, got {response.status_code}")
-                print(f"   Response: {response.text[:200]}")
+                print(f"   Response: {preview}")
                 return False, {}
 
         except Exception as e:
@@ -69,13 +68,13 @@ class GameShopNepalAPITester:
             print(f"❌ FAILED - Error: {str(e)}")
             return False, {}
 
-    def test_root_endpoint(self):
+    async def test_root_endpoint(self):
         """Test root API endpoint"""
-        return self.run_test("Root API", "GET", "", 200)
+        return await self.run_test("Root API", "GET", "", 200)
 
-    def test_admin_login(self):
+    async def test_admin_login(self):
         """Test admin login"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Admin Login",
             "POST",
             "auth/login",
@@ -88,9 +87,9 @@ class GameShopNepalAPITester:
             return True
         return False
 
-    def test_admin_register(self):
+    async def test_admin_register(self):
         """Test admin registration (should fail if user exists)"""
-        success, response = self.run_test(
+        success, response = await self.run_test(
             "Admin Register (existing user)",
             "POST", 
             "auth/register",
@@ -99,24 +98,24 @@ class GameShopNepalAPITester:
         )
         return success
 
-    def test_get_me(self):
+    async def test_get_me(self):
         """Test get current user"""
-        return self.run_test("Get Current User", "GET", "auth/me", 200)[0]
+        return (await self.run_test("Get Current User", "GET", "auth/me", 200))[0]
 
-    def test_categories(self):
+    async def test_categories(self):
         """Test categories endpoints"""
         # Get categories
-        success, categories = self.run_test("Get Categories", "GET", "categories", 200)
+        success, categories = await self.run_test("Get Categories", "GET", "categories", 200)
         if not success:
             return False
         
         print(f"   Found {len(categories)} categories")
         return True
 
-    def test_products(self):
+    async def test_products(self):
         """Test products endpoints"""
         # Get all products
-        success, products = self.run_test("Get All Products", "GET", "products", 200)
+        success, products = await self.run_test("Get All Products", "GET", "products", 200)
         if not success:
             return False
         
@@ -125,7 +124,7 @@ class GameShopNepalAPITester:
         # Test getting a specific product if any exist
         if products and len(products) > 0:
             product_id = products[0]['id']
-            success, product = self.run_test(
+            success, product = await self.run_test(
                 f"Get Product {product_id}", 
                 "GET", 
                 f"products/{product_id}", 
@@ -136,31 +135,31 @@ class GameShopNepalAPITester:
         
         return True
 
-    def test_reviews(self):
+    async def test_reviews(self):
         """Test reviews endpoints"""
-        success, reviews = self.run_test("Get Reviews", "GET", "reviews", 200)
+        success, reviews = await self.run_test("Get Reviews", "GET", "reviews", 200)
         if not success:
             return False
         
         print(f"   Found {len(reviews)} reviews")
         return True
 
-    def test_social_links(self):
+    async def test_social_links(self):
         """Test social links endpoints"""
-        success, links = self.run_test("Get Social Links", "GET", "social-links", 200)
+        success, links = await self.run_test("Get Social Links", "GET", "social-links", 200)
         if not success:
             return False
         
         print(f"   Found {len(links)} social links")
         return True
 
-    def test_pages(self):
+    async def test_pages(self):
         """Test pages endpoints"""
         pages = ['about', 'contact', 'faq']
         all_passed = True
         
         for page in pages:
-            success, page_data = self.run_test(f"Get {page.title()} Page", "GET", f"pages/{page}", 200)
+            success, page_data = await self.run_test(f"Get {page.title()} Page", "GET", f"pages/{page}", 200)
             if success:
                 print(f"   {page.title()} page title: {page_data.get('title', 'No title')}")
             else:
@@ -168,11 +167,11 @@ class GameShopNepalAPITester:
         
         return all_passed
 
-    def test_seed_data(self):
+    async def test_seed_data(self):
         """Test seed data endpoint"""
-        return self.run_test("Seed Data", "POST", "seed", 200)[0]
+        return (await self.run_test("Seed Data", "POST", "seed", 200))[0]
 
-    def test_product_crud(self):
+    async def test_product_crud(self):
         """Test product CRUD operations (requires authentication)"""
         if not self.token:
             print("❌ Skipping CRUD tests - no authentication token")
@@ -195,7 +194,7 @@ class GameShopNepalAPITester:
             "is_sold_out": False
         }
         
-        success, created_product = self.run_test(
+        success, created_product = await self.run_test(
             "Create Product",
             "POST",
             "products",
@@ -213,7 +212,7 @@ class GameShopNepalAPITester:
         
         # Update the product
         test_product['name'] = "Updated Test Product"
-        success, updated_product = self.run_test(
+        success, updated_product = await self.run_test(
             "Update Product",
             "PUT",
             f"products/{product_id}",
@@ -225,7 +224,7 @@ class GameShopNepalAPITester:
             return False
         
         # Delete the product
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Delete Product",
             "DELETE",
             f"products/{product_id}",
@@ -234,7 +233,7 @@ class GameShopNepalAPITester:
         
         return success
 
-    def test_review_crud(self):
+    async def test_review_crud(self):
         """Test review CRUD operations (requires authentication)"""
         if not self.token:
             print("❌ Skipping Review CRUD tests - no authentication token")
@@ -248,7 +247,7 @@ class GameShopNepalAPITester:
             "review_date": datetime.now().isoformat()
         }
         
-        success, created_review = self.run_test(
+        success, created_review = await self.run_test(
             "Create Review",
             "POST",
             "reviews",
@@ -266,7 +265,7 @@ class GameShopNepalAPITester:
         
         # Update the review
         test_review['comment'] = "Updated test review"
-        success, updated_review = self.run_test(
+        success, updated_review = await self.run_test(
             "Update Review",
             "PUT",
             f"reviews/{review_id}",
@@ -278,7 +277,7 @@ class GameShopNepalAPITester:
             return False
         
         # Delete the review
-        success, _ = self.run_test(
+        success, _ = await self.run_test(
             "Delete Review",
             "DELETE",
             f"reviews/{review_id}",
@@ -287,40 +286,59 @@ class GameShopNepalAPITester:
         
         return success
 
-def main():
+async def run_suite(tester, test_name, test_func):
+    print(f"\n{'='*20} {test_name} {'='*20}")
+    try:
+        await test_func()
+    except Exception as e:
+        print(f"❌ Test suite '{test_name}' crashed: {str(e)}")
+        tester.failed_tests.append({
+            "test": test_name,
+            "error": f"Test suite crashed: {str(e)}"
+        })
+
+async def main():
     print("🚀 Starting GameShop Nepal API Tests")
     print("=" * 50)
     
     tester = GameShopNepalAPITester()
     
-    # Test sequence
-    tests = [
+    # Setup has ordering dependencies: seed before reads, login sets the token
+    serial_tests = [
         ("Root Endpoint", tester.test_root_endpoint),
         ("Seed Data", tester.test_seed_data),
         ("Admin Login", tester.test_admin_login),
         ("Admin Register (existing)", tester.test_admin_register),
         ("Get Current User", tester.test_get_me),
+    ]
+    # Independent read-only suites run concurrently, so wall clock is the
+    # slowest suite instead of the sum of all of them
+    parallel_tests = [
         ("Categories", tester.test_categories),
         ("Products", tester.test_products),
         ("Reviews", tester.test_reviews),
         ("Social Links", tester.test_social_links),
         ("Pages", tester.test_pages),
+    ]
+    # CRUD flows stay serial: each step feeds the next (create -> update -> delete)
+    crud_tests = [
         ("Product CRUD", tester.test_product_crud),
         ("Review CRUD", tester.test_review_crud),
     ]
     
-    print(f"\n📋 Running {len(tests)} test suites...")
+    total_suites = len(serial_tests) + len(parallel_tests) + len(crud_tests)
+    print(f"\n📋 Running {total_suites} test suites...")
     
-    for test_name, test_func in tests:
-        print(f"\n{'='*20} {test_name} {'='*20}")
-        try:
-            test_func()
-        except Exception as e:
-            print(f"❌ Test suite '{test_name}' crashed: {str(e)}")
-            tester.failed_tests.append({
-                "test": test_name,
-                "error": f"Test suite crashed: {str(e)}"
-            })
+    try:
+        for test_name, test_func in serial_tests:
+            await run_suite(tester, test_name, test_func)
+        
+        await asyncio.gather(*(run_suite(tester, name, func) for name, func in parallel_tests))
+        
+        for test_name, test_func in crud_tests:
+            await run_suite(tester, test_name, test_func)
+    finally:
+        await tester.client.aclose()
     
     # Print final results
     print(f"\n{'='*50}")
@@ -350,4 +368,4 @@ def main():
     return 0 if success_rate >= 80 else 1
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(asyncio.run(main()))
\ No newline at end of file